@@ -25,6 +25,11 @@ class Settings(BaseSettings):
             return self.DATABASE_URL
         return f"sqlite:///{self.DATABASE_PATH}"
     
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    
     # RS Calculation
     RS_SMA_PERIOD_WEEKS: int = 52
     BENCHMARK_TICKER: str = "SPY"
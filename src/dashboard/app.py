@@ -17,6 +17,7 @@ from src.dashboard.layouts.ticker_layout import create_layout as create_ticker_l
 from src.dashboard.callbacks import register_callbacks
 from src.dashboard.callbacks.stock_callbacks import register_stock_callbacks
 from src.dashboard.callbacks.ticker_callbacks import register_ticker_callbacks
+from src.models import ScopedSession
 
 # Get the assets folder path relative to this file
 ASSETS_PATH = os.path.join(os.path.dirname(__file__), "assets")
@@ -75,6 +76,11 @@ def create_dash_app(server=None, routes_pathname_prefix: str = "/", requests_pat
     # Set layout to app shell with routing
     app.layout = create_app_layout()
     
+    # Return the callbacks' scoped database session to the pool after each request
+    @app.server.teardown_appcontext
+    def remove_scoped_session(exc=None):
+        ScopedSession.remove()
+    
     # Register page routing callback
     @app.callback(
         Output('page-content', 'children'),
@@ -0,0 +1,62 @@
+/*
+ * Clientside callbacks for the stock drilldown page.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    stock: {
+        /*
+         * Show the most recent `numWeeks` columns of the stock heatmap.
+         *
+         * `figure` is the full-range heatmap from stock-heatmap-figure-store
+         * (heatmap trace + invisible scatter for the top axis). Copies are
+         * returned so the stored figure stays intact for later slider moves.
+         */
+        updateWeeks: function(figure, numWeeks) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            if (!figure.data || !figure.data.length || figure.data[0].type !== "heatmap") {
+                // Empty/error placeholder figure - nothing to slice
+                return figure;
+            }
+
+            const sliceRows = (rows) => rows.map((row) => row.slice(0, numWeeks));
+            const heatmap = figure.data[0];
+            const weeks = heatmap.x.slice(0, numWeeks);
+
+            const data = [
+                Object.assign({}, heatmap, {
+                    x: weeks,
+                    z: sliceRows(heatmap.z),
+                    customdata: sliceRows(heatmap.customdata),
+                }),
+            ].concat(figure.data.slice(1).map((trace) => Object.assign({}, trace, {
+                x: weeks,
+                y: trace.y.slice(0, numWeeks),
+            })));
+
+            const xaxis2 = Object.assign({}, figure.layout.xaxis2, {
+                tickvals: weeks,
+                ticktext: weeks,
+                range: [-0.5, weeks.length - 0.5],
+            });
+
+            return Object.assign({}, figure, {
+                data: data,
+                layout: Object.assign({}, figure.layout, {xaxis2: xaxis2}),
+            });
+        },
+
+        /*
+         * Build the stats line under the heatmap.
+         *
+         * `stats` from stock-stats-store is either {shown, metric} for a
+         * loaded sub-industry, or a plain message (empty or error) shown as is.
+         */
+        updateStats: function(stats, numWeeks) {
+            if (!stats || typeof stats === "string") {
+                return stats || "";
+            }
+            return stats.shown + " | " + numWeeks + " weeks | " + stats.metric;
+        },
+    },
+});
@@ -16,7 +16,7 @@ import plotly.graph_objects as go
 from dash import callback, Input, Output, State, html, no_update, dcc
 import dash_bootstrap_components as dbc
 
-from src.models import SessionLocal
+from src.models import ScopedSession
 from src.services.data_service import (
     get_rs_matrix_data,
     get_sector_rs_matrix_data,
@@ -26,6 +26,7 @@ from src.services.data_service import (
     get_subindustry_stocks,
     get_data_stats,
 )
+from src.dashboard.layouts import _classnames as cn
 from src.dashboard.utils.colors import get_color_scale, get_strength_label
 from src.dashboard.utils.etf_mapper import (
     get_etf_for_subindustry,
@@ -102,20 +103,20 @@ def register_callbacks(app):
             page_title = "📊 Technical Rank (SCTR) Industry Dashboard"
             page_subtitle = "StockCharts Technical Rank by GICS Sub-Industry | Weekly Analysis"
             legend = [
-                html.Span("🔴 Lagging (0-40)", className="mx-3"),
-                html.Span("🟡 Neutral (40-60)", className="mx-3"),
-                html.Span("🟢 Leading (60-100)", className="mx-3"),
+                html.Span("🔴 Lagging (0-40)", className=cn.LEGEND_ITEM),
+                html.Span("🟡 Neutral (40-60)", className=cn.LEGEND_ITEM),
+                html.Span("🟢 Leading (60-100)", className=cn.LEGEND_ITEM),
             ]
         else:
             page_title = "📊 Relative Strength Industry Dashboard"
             page_subtitle = "Mansfield RS by GICS Sub-Industry | Weekly Analysis"
             legend = [
-                html.Span("🔴 Weak (Bottom 33%)", className="mx-3"),
-                html.Span("🟡 Neutral (Middle 34%)", className="mx-3"),
-                html.Span("🟢 Strong (Top 33%)", className="mx-3"),
+                html.Span("🔴 Weak (Bottom 33%)", className=cn.LEGEND_ITEM),
+                html.Span("🟡 Neutral (Middle 34%)", className=cn.LEGEND_ITEM),
+                html.Span("🟢 Strong (Top 33%)", className=cn.LEGEND_ITEM),
             ]
         
-        db = SessionLocal()
+        db = ScopedSession()
         try:
             # Get data based on active tab
             if is_sctr:
@@ -181,8 +182,6 @@ def register_callbacks(app):
                 font=dict(color="#ef4444"),
             )
             return error_fig, [], "Error loading data", {"display": "none"}, None, page_title, page_subtitle, legend
-        finally:
-            db.close()
     
     @app.callback(
         Output("sector-heatmap", "figure"),
@@ -197,7 +196,7 @@ def register_callbacks(app):
         is_sctr = active_tab == "sctr"
         metric_name = "SCTR" if is_sctr else "RS"
         
-        db = SessionLocal()
+        db = ScopedSession()
         try:
             # Get sector data based on active tab
             if is_sctr:
@@ -247,8 +246,6 @@ def register_callbacks(app):
                 height=200,
             )
             return error_fig, None
-        finally:
-            db.close()
     
     @app.callback(
         Output("detail-panel", "children", allow_duplicate=True),
@@ -424,21 +421,18 @@ def show_tradingview_for_subindustry(subindustry_name: str):
     hidden_style = {"display": "none"}
     visible_style = {"display": "block", "marginTop": "2.5rem", "paddingTop": "1rem"}
     
-    db = SessionLocal()
-    try:
-        from src.models import GICSSubIndustry
-        subindustry = db.query(GICSSubIndustry).filter(
-            GICSSubIndustry.name == subindustry_name
-        ).first()
-        
-        if subindustry:
-            stocks = get_subindustry_stocks(db, subindustry.code)
-            sector_name = subindustry.sector_name
-        else:
-            stocks = []
-            sector_name = None
-    finally:
-        db.close()
+    db = ScopedSession()
+    from src.models import GICSSubIndustry
+    subindustry = db.query(GICSSubIndustry).filter(
+        GICSSubIndustry.name == subindustry_name
+    ).first()
+    
+    if subindustry:
+        stocks = get_subindustry_stocks(db, subindustry.code)
+        sector_name = subindustry.sector_name
+    else:
+        stocks = []
+        sector_name = None
     
     # Format stocks list
     if stocks:
@@ -495,21 +489,18 @@ def show_detail_panel_content(subindustry_name: str, week_label: str, percentile
     hidden_style = {"display": "none"}
     visible_style = {"display": "block", "marginTop": "2.5rem", "paddingTop": "1rem"}
     
-    db = SessionLocal()
-    try:
-        from src.models import GICSSubIndustry
-        subindustry = db.query(GICSSubIndustry).filter(
-            GICSSubIndustry.name == subindustry_name
-        ).first()
-        
-        if subindustry:
-            stocks = get_subindustry_stocks(db, subindustry.code)
-            sector_name = subindustry.sector_name
-        else:
-            stocks = []
-            sector_name = None
-    finally:
-        db.close()
+    db = ScopedSession()
+    from src.models import GICSSubIndustry
+    subindustry = db.query(GICSSubIndustry).filter(
+        GICSSubIndustry.name == subindustry_name
+    ).first()
+    
+    if subindustry:
+        stocks = get_subindustry_stocks(db, subindustry.code)
+        sector_name = subindustry.sector_name
+    else:
+        stocks = []
+        sector_name = None
     
     # Format stocks list
     if stocks:
@@ -7,14 +7,15 @@ Handles:
 - Page title updates
 """
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from dash import callback, Input, Output, State, html, no_update
+from dash import callback, ClientsideFunction, Input, Output, State, html, no_update
 import dash_bootstrap_components as dbc
 
-from src.models import SessionLocal
+from src.models import ScopedSession
 from src.services.data_service import (
     get_stock_rs_matrix_data,
     get_stock_sctr_matrix_data,
@@ -24,37 +25,60 @@ from src.services.data_service import (
 )
 from plotly.subplots import make_subplots
 
+from src.dashboard.layouts import _classnames as cn
 from src.dashboard.utils.colors import get_color_scale, get_strength_label
 from src.dashboard.utils.heatmap_config import (
     ROW_HEIGHT,
     STOCK_MARGINS,
+    MAX_STOCK_WEEKS,
+    MAX_PRICE_POINTS,
     COLORS,
     FONT_SIZES,
 )
 
 logger = logging.getLogger(__name__)
 
+# Heatmap color scale is fixed, so build it once at import
+_COLOR_SCALE = get_color_scale()
+
 
 def register_stock_callbacks(app):
     """Register all callbacks for the stock drilldown page."""
     
-    @app.callback(
+    # The server builds the heatmap for the full slider range once; moving the
+    # weeks slider only slices week columns and updates the stats line in the
+    # browser (assets/stock.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="stock", function_name="updateWeeks"),
         Output("stock-rs-heatmap", "figure"),
+        Input("stock-heatmap-figure-store", "data"),
+        Input("stock-weeks-slider", "value"),
+    )
+    app.clientside_callback(
+        ClientsideFunction(namespace="stock", function_name="updateStats"),
+        Output("stock-data-stats", "children"),
+        Input("stock-stats-store", "data"),
+        Input("stock-weeks-slider", "value"),
+    )
+    
+    @app.callback(
+        Output("stock-heatmap-figure-store", "data"),
         Output("stock-page-title", "children"),
         Output("stock-page-subtitle", "children"),
-        Output("stock-data-stats", "children"),
+        Output("stock-stats-store", "data"),
         Output("stock-loading-overlay", "style"),
         Output("stock-color-legend", "children"),
+        Output("stock-name-map", "data"),
         Input("stock-subindustry-code", "data"),
         Input("stock-sort-method", "value"),
-        Input("stock-weeks-slider", "value"),
         Input("stock-metric-tabs", "active_tab"),
+        Input("stock-top-n", "value"),
     )
     def update_stock_heatmap(
         subindustry_code: Optional[str],
         sort_method: str,
-        num_weeks: int,
-        active_tab: str
+        active_tab: str,
+        top_n: int,
     ):
         """Generate and update the stock-level RS or SCTR heatmap based on active tab."""
         
@@ -65,15 +89,15 @@ def register_stock_callbacks(app):
         # Set legend based on active tab
         if is_sctr:
             legend = [
-                html.Span("🔴 Lagging (0-40)", className="mx-3"),
-                html.Span("🟡 Neutral (40-60)", className="mx-3"),
-                html.Span("🟢 Leading (60-100)", className="mx-3"),
+                html.Span("🔴 Lagging (0-40)", className=cn.LEGEND_ITEM),
+                html.Span("🟡 Neutral (40-60)", className=cn.LEGEND_ITEM),
+                html.Span("🟢 Leading (60-100)", className=cn.LEGEND_ITEM),
             ]
         else:
             legend = [
-                html.Span("🔴 Weak (Bottom 33%)", className="mx-3"),
-                html.Span("🟡 Neutral (Middle 34%)", className="mx-3"),
-                html.Span("🟢 Strong (Top 33%)", className="mx-3"),
+                html.Span("🔴 Weak (Bottom 33%)", className=cn.LEGEND_ITEM),
+                html.Span("🟡 Neutral (Middle 34%)", className=cn.LEGEND_ITEM),
+                html.Span("🟢 Strong (Top 33%)", className=cn.LEGEND_ITEM),
             ]
         
         # Style to hide the loading overlay
@@ -93,11 +117,13 @@ def register_stock_callbacks(app):
                 "Select a sub-industry from the main page",
                 "",
                 hide_overlay,
-                legend
+                legend,
+                {}
             )
         
-        db = SessionLocal()
         try:
+            db = ScopedSession()
+            
             # Get sub-industry info for title
             subindustry_info = get_subindustry_info(db, subindustry_code)
             
@@ -115,22 +141,23 @@ def register_stock_callbacks(app):
                     "Sub-industry not found",
                     "",
                     hide_overlay,
-                    legend
+                    legend,
+                    {}
                 )
             
-            # Get stock data based on active tab
+            # Get stock data based on active tab (full slider range)
             if is_sctr:
                 df = get_stock_sctr_matrix_data(
                     db=db,
                     subindustry_code=subindustry_code,
-                    num_weeks=num_weeks,
+                    num_weeks=MAX_STOCK_WEEKS,
                     sort_by=sort_method
                 )
             else:
                 df = get_stock_rs_matrix_data(
                     db=db,
                     subindustry_code=subindustry_code,
-                    num_weeks=num_weeks,
+                    num_weeks=MAX_STOCK_WEEKS,
                     sort_by=sort_method
                 )
             
@@ -141,9 +168,17 @@ def register_stock_callbacks(app):
             else:
                 subtitle = f"{subindustry_info['sector_name']} | Click any cell to see price chart with RS indicator"
             
+            # Trim large sub-industries to the top N stocks to bound render cost
+            total_count = df['ticker'].nunique() if not df.empty else 0
+            df = limit_top_stocks(df, "sctr_percentile" if is_sctr else "rs_percentile", top_n)
+            
             # Stats
             stock_count = df['ticker'].nunique() if not df.empty else 0
-            stats_text = f"Showing {stock_count} stocks | {num_weeks} weeks | {metric_name} ranking"
+            if stock_count < total_count:
+                shown_text = f"Showing top {stock_count} of {total_count} stocks"
+            else:
+                shown_text = f"Showing {stock_count} stocks"
+            stats = {"shown": shown_text, "metric": f"{metric_name} ranking"}
             
             if df.empty:
                 empty_fig = go.Figure()
@@ -153,15 +188,19 @@ def register_stock_callbacks(app):
                     plot_bgcolor=COLORS["plot_bg"],
                     font=dict(color=COLORS["text"]),
                 )
-                return empty_fig, title, subtitle, stats_text, hide_overlay, legend
+                return empty_fig, title, subtitle, stats, hide_overlay, legend, {}
+            
+            # Ticker -> name map, shared by the figure's hover text and the
+            # store so cell clicks don't need a DB lookup
+            name_map = stock_name_map(df)
             
             # Create heatmap figure
             if is_sctr:
-                fig = create_stock_sctr_heatmap_figure(df, num_weeks)
+                fig = create_stock_sctr_heatmap_figure(df, name_map)
             else:
-                fig = create_stock_heatmap_figure(df, num_weeks)
+                fig = create_stock_heatmap_figure(df, name_map)
             
-            return fig, title, subtitle, stats_text, hide_overlay, legend
+            return fig, title, subtitle, stats, hide_overlay, legend, name_map
             
         except Exception as e:
             logger.exception(f"Error updating stock heatmap: {e}")
@@ -171,9 +210,7 @@ def register_stock_callbacks(app):
                 paper_bgcolor=COLORS["paper_bg"],
                 font=dict(color="#ef4444"),
             )
-            return error_fig, f"📈 Stock {metric_name} Heatmap", "Error", "Error loading data", hide_overlay, legend
-        finally:
-            db.close()
+            return error_fig, f"📈 Stock {metric_name} Heatmap", "Error", "Error loading data", hide_overlay, legend, {}
     
     @app.callback(
         Output("stock-detail-panel", "children"),
@@ -185,8 +222,9 @@ def register_stock_callbacks(app):
         Input("chart-timeframe-tabs", "active_tab"),
         State("stock-subindustry-code", "data"),
         State("selected-stock-store", "data"),
+        State("stock-name-map", "data"),
     )
-    def show_stock_detail_panel(click_data, timeframe, subindustry_code, stored_stock):
+    def show_stock_detail_panel(click_data, timeframe, subindustry_code, stored_stock, name_map):
         """Show price chart with RS indicator when any stock cell is clicked or timeframe changes."""
         from dash import ctx
         
@@ -222,14 +260,16 @@ def register_stock_callbacks(app):
             week_label = point['x']
             percentile = point.get('z')
             
-            # Get stock name from database
-            db = SessionLocal()
-            try:
-                from src.models import Stock
-                stock = db.query(Stock).filter(Stock.ticker == ticker).first()
-                stock_name = stock.name if stock else ticker
-            finally:
-                db.close()
+            # Same cell clicked again - the panel and chart already show it
+            if stored_stock and (
+                stored_stock.get("ticker"),
+                stored_stock.get("week_label"),
+                stored_stock.get("percentile"),
+            ) == (ticker, week_label, percentile):
+                return no_update, no_update, no_update, no_update, no_update
+            
+            # Stock name comes from the map stored alongside the heatmap
+            stock_name = (name_map or {}).get(ticker, ticker)
         else:
             # No click data and no stored stock
             return (
@@ -253,15 +293,12 @@ def register_stock_callbacks(app):
             }
             
             # Get price data from database
-            db = SessionLocal()
-            try:
-                # Choose data based on timeframe
-                if timeframe == "weekly":
-                    price_df = get_stock_price_with_rs_weekly(db, ticker, num_weeks=104)
-                else:
-                    price_df = get_stock_price_with_rs(db, ticker, num_weeks=52)
-            finally:
-                db.close()
+            db = ScopedSession()
+            # Choose data based on timeframe
+            if timeframe == "weekly":
+                price_df = get_stock_price_with_rs_weekly(db, ticker, num_weeks=104)
+            else:
+                price_df = get_stock_price_with_rs(db, ticker, num_weeks=52)
             
             # Chart title with timeframe indicator
             timeframe_label = "Weekly" if timeframe == "weekly" else "Daily"
@@ -324,7 +361,24 @@ def register_stock_callbacks(app):
             )
 
 
-def create_stock_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Figure:
+def stock_name_map(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Map each ticker in a stock matrix frame to its name.
+    
+    Args:
+        df: DataFrame with stock matrix data (ticker and stock_name columns)
+    
+    Returns:
+        Dict of ticker -> stock name, in first-appearance (sort) order
+    """
+    firsts = df.drop_duplicates('ticker')
+    return dict(zip(firsts['ticker'].tolist(), firsts['stock_name'].tolist()))
+
+
+def create_stock_heatmap_figure(
+    df: pd.DataFrame,
+    stock_names: Optional[Dict[str, str]] = None
+) -> dict:
     """
     Create the Plotly heatmap figure for individual stocks.
     
@@ -337,38 +391,33 @@ def create_stock_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Figure:
     
     Args:
         df: DataFrame with stock RS matrix data
-        num_weeks: Number of weeks to display
+        stock_names: Ticker -> name map from stock_name_map (built from df if omitted)
     
     Returns:
-        Plotly Figure object
+        Plotly figure dict
     """
-    from datetime import datetime
+    # Rows arrive grouped by stock in sort order with the most recent week
+    # first, so first appearances give both orders (most recent week on the left)
+    week_order = df['week_label'].drop_duplicates().tolist()
+    if stock_names is None:
+        stock_names = stock_name_map(df)
+    unique_stocks = list(stock_names)
     
     # Pivot for heatmap: rows = stocks (ticker), columns = weeks
     pivot_df = df.pivot(
         index='ticker',
         columns='week_label',
         values='rs_percentile'
-    )
-    
-    # Sort weeks: most recent FIRST (left side)
-    week_order = sorted(pivot_df.columns, key=lambda x: datetime.strptime(x, "%d/%m/%y"), reverse=True)
-    pivot_df = pivot_df[week_order]
-    
-    # Keep stock order from the sorted DataFrame
-    unique_stocks = df.drop_duplicates('ticker')['ticker'].tolist()
-    pivot_df = pivot_df.reindex(unique_stocks)
+    ).reindex(index=unique_stocks, columns=week_order)
     
-    # Create stock name map for hover text
-    stock_names = df.drop_duplicates('ticker').set_index('ticker')['stock_name'].to_dict()
-    
-    # Build hover text matrix
-    hover_text = []
-    for ticker in pivot_df.index:
-        row_text = []
+    # Build hover text matrix as a 2D object array (serialized via the
+    # ndarray path rather than walking nested Python lists)
+    values = pivot_df.to_numpy()
+    hover_text = np.empty(values.shape, dtype=object)
+    for i, ticker in enumerate(pivot_df.index):
         stock_name = stock_names.get(ticker, ticker)
-        for week in pivot_df.columns:
-            value = pivot_df.loc[ticker, week]
+        for j, week in enumerate(pivot_df.columns):
+            value = values[i, j]
             if pd.isna(value):
                 text = f"<b>{ticker}</b><br>{stock_name}<br>Week: {week}<br>No data"
             else:
@@ -380,34 +429,12 @@ def create_stock_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Figure:
                     f"RS Percentile: {value:.0f}<br>"
                     f"Strength: {strength}"
                 )
-            row_text.append(text)
-        hover_text.append(row_text)
-    
-    # Create heatmap without colorbar
-    fig = go.Figure(data=go.Heatmap(
-        z=pivot_df.values,
-        x=pivot_df.columns.tolist(),
-        y=pivot_df.index.tolist(),
-        colorscale=get_color_scale(),
-        zmin=0,
-        zmax=100,
-        hovertemplate="%{customdata}<extra></extra>",
-        customdata=hover_text,
-        xgap=1,
-        ygap=1,
-        showscale=False,  # Hide colorbar
-    ))
-    
-    # Add invisible scatter trace to enable top x-axis labels
-    fig.add_trace(go.Scatter(
-        x=pivot_df.columns.tolist(),
-        y=[None] * len(pivot_df.columns),
-        xaxis="x2",
-        mode="markers",
-        marker=dict(opacity=0),
-        showlegend=False,
-        hoverinfo="skip",
-    ))
+            hover_text[i, j] = text
+    
+    # Build the figure as a raw dict: Dash serializes it directly and we skip
+    # Plotly's per-element validators, which dominate for large heatmaps.
+    weeks = pivot_df.columns.tolist()
+    grid = dict(showgrid=True, gridwidth=1, gridcolor=COLORS["grid"])
     
     # Calculate chart height with fixed row height of 32px
     num_stocks = len(pivot_df)
@@ -417,103 +444,128 @@ def create_stock_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Figure:
     bottom_margin = STOCK_MARGINS["bottom"]
     chart_height = num_stocks * fixed_row_height + top_margin + bottom_margin
     
-    # Layout with title, subtitle, and dual x-axis (top and bottom)
-    fig.update_layout(
-        title=dict(
-            text="Individual Stock Relative Strength<br><sup>← Most Recent | Weeks | Older →</sup>",
-            font=dict(size=FONT_SIZES["subtitle"], color=COLORS["title"]),
-            x=0.5,
-            xanchor="center",
-            y=0.88,  # Lowered to prevent cutoff
-            yanchor="top",
-        ),
-        xaxis=dict(
-            title=None,
-            side="bottom",
-            dtick=1,
-            fixedrange=True,
-            showticklabels=False,  # Hide bottom x-axis labels
-        ),
-        xaxis2=dict(
-            title=None,
-            tickfont=dict(size=FONT_SIZES["axis_label"], color=COLORS["muted_text"]),
-            tickangle=-45,
-            side="top",
-            anchor="y",
-            overlaying="x",
-            fixedrange=True,
-            showticklabels=True,
-            tickmode="array",
-            tickvals=pivot_df.columns.tolist(),
-            ticktext=pivot_df.columns.tolist(),
-            range=[-0.5, len(pivot_df.columns) - 0.5],
-        ),
-        yaxis=dict(
-            title=None,
-            tickfont=dict(size=FONT_SIZES["stock_axis_label"], color=COLORS["muted_text"]),
-            autorange="reversed",
-            tickmode="linear",
-            dtick=1,
-            fixedrange=True,
-            ticklabelposition="outside",
-        ),
-        paper_bgcolor=COLORS["paper_bg"],
-        plot_bgcolor=COLORS["plot_bg"],
-        font=dict(color=COLORS["text"]),
-        height=chart_height,
-        margin=dict(
-            l=STOCK_MARGINS["left"],
-            r=STOCK_MARGINS["right"],
-            t=top_margin,
-            b=bottom_margin
-        ),
-    )
-    
-    # Add grid lines
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor=COLORS["grid"])
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor=COLORS["grid"])
-    
-    return fig
+    return {
+        "data": [
+            # Heatmap without colorbar
+            {
+                "type": "heatmap",
+                "z": values,
+                "x": weeks,
+                "y": pivot_df.index.tolist(),
+                "colorscale": _COLOR_SCALE,
+                "zmin": 0,
+                "zmax": 100,
+                "hovertemplate": "%{customdata}<extra></extra>",
+                "customdata": hover_text,
+                "xgap": 1,
+                "ygap": 1,
+                "showscale": False,
+            },
+            # Invisible scatter trace to enable top x-axis labels
+            {
+                "type": "scatter",
+                "x": weeks,
+                "y": [None] * len(weeks),
+                "xaxis": "x2",
+                "mode": "markers",
+                "marker": {"opacity": 0},
+                "showlegend": False,
+                "hoverinfo": "skip",
+            },
+        ],
+        # Layout with title, subtitle, and dual x-axis (top and bottom)
+        "layout": {
+            "title": {
+                "text": "Individual Stock Relative Strength<br><sup>← Most Recent | Weeks | Older →</sup>",
+                "font": {"size": FONT_SIZES["subtitle"], "color": COLORS["title"]},
+                "x": 0.5,
+                "xanchor": "center",
+                "y": 0.88,  # Lowered to prevent cutoff
+                "yanchor": "top",
+            },
+            "xaxis": {
+                "title": None,
+                "side": "bottom",
+                "dtick": 1,
+                "fixedrange": True,
+                "showticklabels": False,  # Hide bottom x-axis labels
+                **grid,
+            },
+            "xaxis2": {
+                "title": None,
+                "tickfont": {"size": FONT_SIZES["axis_label"], "color": COLORS["muted_text"]},
+                "tickangle": -45,
+                "side": "top",
+                "anchor": "y",
+                "overlaying": "x",
+                "fixedrange": True,
+                "showticklabels": True,
+                "tickmode": "array",
+                "tickvals": weeks,
+                "ticktext": weeks,
+                "range": [-0.5, len(weeks) - 0.5],
+                **grid,
+            },
+            "yaxis": {
+                "title": None,
+                "tickfont": {"size": FONT_SIZES["stock_axis_label"], "color": COLORS["muted_text"]},
+                "autorange": "reversed",
+                "tickmode": "linear",
+                "dtick": 1,
+                "fixedrange": True,
+                "ticklabelposition": "outside",
+                **grid,
+            },
+            "paper_bgcolor": COLORS["paper_bg"],
+            "plot_bgcolor": COLORS["plot_bg"],
+            "font": {"color": COLORS["text"]},
+            "height": chart_height,
+            "margin": {
+                "l": STOCK_MARGINS["left"],
+                "r": STOCK_MARGINS["right"],
+                "t": top_margin,
+                "b": bottom_margin,
+            },
+        },
+    }
 
 
-def create_stock_sctr_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Figure:
+def create_stock_sctr_heatmap_figure(
+    df: pd.DataFrame,
+    stock_names: Optional[Dict[str, str]] = None
+) -> dict:
     """
     Create the Plotly SCTR heatmap figure for individual stocks.
     
     Args:
         df: DataFrame with stock SCTR matrix data
-        num_weeks: Number of weeks to display
+        stock_names: Ticker -> name map from stock_name_map (built from df if omitted)
     
     Returns:
-        Plotly Figure object
+        Plotly figure dict
     """
-    from datetime import datetime
+    # Rows arrive grouped by stock in sort order with the most recent week
+    # first, so first appearances give both orders (most recent week on the left)
+    week_order = df['week_label'].drop_duplicates().tolist()
+    if stock_names is None:
+        stock_names = stock_name_map(df)
+    unique_stocks = list(stock_names)
     
     # Pivot for heatmap: rows = stocks (ticker), columns = weeks
     pivot_df = df.pivot(
         index='ticker',
         columns='week_label',
         values='sctr_percentile'
-    )
-    
-    # Sort weeks: most recent FIRST (left side)
-    week_order = sorted(pivot_df.columns, key=lambda x: datetime.strptime(x, "%d/%m/%y"), reverse=True)
-    pivot_df = pivot_df[week_order]
-    
-    # Keep stock order from the sorted DataFrame
-    unique_stocks = df.drop_duplicates('ticker')['ticker'].tolist()
-    pivot_df = pivot_df.reindex(unique_stocks)
+    ).reindex(index=unique_stocks, columns=week_order)
     
-    # Create stock name map for hover text
-    stock_names = df.drop_duplicates('ticker').set_index('ticker')['stock_name'].to_dict()
-    
-    # Build hover text matrix
-    hover_text = []
-    for ticker in pivot_df.index:
-        row_text = []
+    # Build hover text matrix as a 2D object array (serialized via the
+    # ndarray path rather than walking nested Python lists)
+    values = pivot_df.to_numpy()
+    hover_text = np.empty(values.shape, dtype=object)
+    for i, ticker in enumerate(pivot_df.index):
         stock_name = stock_names.get(ticker, ticker)
-        for week in pivot_df.columns:
-            value = pivot_df.loc[ticker, week]
+        for j, week in enumerate(pivot_df.columns):
+            value = values[i, j]
             if pd.isna(value):
                 text = f"<b>{ticker}</b><br>{stock_name}<br>Week: {week}<br>No data"
             else:
@@ -525,34 +577,12 @@ def create_stock_sctr_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Fig
                     f"SCTR Percentile: {value:.0f}<br>"
                     f"Strength: {strength}"
                 )
-            row_text.append(text)
-        hover_text.append(row_text)
-    
-    # Create heatmap without colorbar
-    fig = go.Figure(data=go.Heatmap(
-        z=pivot_df.values,
-        x=pivot_df.columns.tolist(),
-        y=pivot_df.index.tolist(),
-        colorscale=get_color_scale(),
-        zmin=0,
-        zmax=100,
-        hovertemplate="%{customdata}<extra></extra>",
-        customdata=hover_text,
-        xgap=1,
-        ygap=1,
-        showscale=False,  # Hide colorbar
-    ))
-    
-    # Add invisible scatter trace to enable top x-axis labels
-    fig.add_trace(go.Scatter(
-        x=pivot_df.columns.tolist(),
-        y=[None] * len(pivot_df.columns),
-        xaxis="x2",
-        mode="markers",
-        marker=dict(opacity=0),
-        showlegend=False,
-        hoverinfo="skip",
-    ))
+            hover_text[i, j] = text
+    
+    # Build the figure as a raw dict: Dash serializes it directly and we skip
+    # Plotly's per-element validators, which dominate for large heatmaps.
+    weeks = pivot_df.columns.tolist()
+    grid = dict(showgrid=True, gridwidth=1, gridcolor=COLORS["grid"])
     
     # Calculate chart height with fixed row height of 32px
     num_stocks = len(pivot_df)
@@ -562,63 +592,143 @@ def create_stock_sctr_heatmap_figure(df: pd.DataFrame, num_weeks: int) -> go.Fig
     bottom_margin = STOCK_MARGINS["bottom"]
     chart_height = num_stocks * fixed_row_height + top_margin + bottom_margin
     
-    # Layout with title, subtitle, and dual x-axis (top and bottom)
-    fig.update_layout(
-        title=dict(
-            text="Individual Stock Technical Rank (SCTR)<br><sup>← Most Recent | Weeks | Older →</sup>",
-            font=dict(size=FONT_SIZES["subtitle"], color=COLORS["title"]),
-            x=0.5,
-            xanchor="center",
-            y=0.88,  # Lowered to prevent cutoff
-            yanchor="top",
-        ),
-        xaxis=dict(
-            title=None,
-            side="bottom",
-            dtick=1,
-            fixedrange=True,
-            showticklabels=False,  # Hide bottom x-axis labels
-        ),
-        xaxis2=dict(
-            title=None,
-            tickfont=dict(size=FONT_SIZES["axis_label"], color=COLORS["muted_text"]),
-            tickangle=-45,
-            side="top",
-            anchor="y",
-            overlaying="x",
-            fixedrange=True,
-            showticklabels=True,
-            tickmode="array",
-            tickvals=pivot_df.columns.tolist(),
-            ticktext=pivot_df.columns.tolist(),
-            range=[-0.5, len(pivot_df.columns) - 0.5],
-        ),
-        yaxis=dict(
-            title=None,
-            tickfont=dict(size=FONT_SIZES["stock_axis_label"], color=COLORS["muted_text"]),
-            autorange="reversed",
-            tickmode="linear",
-            dtick=1,
-            fixedrange=True,
-            ticklabelposition="outside",
-        ),
-        paper_bgcolor=COLORS["paper_bg"],
-        plot_bgcolor=COLORS["plot_bg"],
-        font=dict(color=COLORS["text"]),
-        height=chart_height,
-        margin=dict(
-            l=STOCK_MARGINS["left"],
-            r=STOCK_MARGINS["right"],
-            t=top_margin,
-            b=bottom_margin
-        ),
-    )
+    return {
+        "data": [
+            # Heatmap without colorbar
+            {
+                "type": "heatmap",
+                "z": values,
+                "x": weeks,
+                "y": pivot_df.index.tolist(),
+                "colorscale": _COLOR_SCALE,
+                "zmin": 0,
+                "zmax": 100,
+                "hovertemplate": "%{customdata}<extra></extra>",
+                "customdata": hover_text,
+                "xgap": 1,
+                "ygap": 1,
+                "showscale": False,
+            },
+            # Invisible scatter trace to enable top x-axis labels
+            {
+                "type": "scatter",
+                "x": weeks,
+                "y": [None] * len(weeks),
+                "xaxis": "x2",
+                "mode": "markers",
+                "marker": {"opacity": 0},
+                "showlegend": False,
+                "hoverinfo": "skip",
+            },
+        ],
+        # Layout with title, subtitle, and dual x-axis (top and bottom)
+        "layout": {
+            "title": {
+                "text": "Individual Stock Technical Rank (SCTR)<br><sup>← Most Recent | Weeks | Older →</sup>",
+                "font": {"size": FONT_SIZES["subtitle"], "color": COLORS["title"]},
+                "x": 0.5,
+                "xanchor": "center",
+                "y": 0.88,  # Lowered to prevent cutoff
+                "yanchor": "top",
+            },
+            "xaxis": {
+                "title": None,
+                "side": "bottom",
+                "dtick": 1,
+                "fixedrange": True,
+                "showticklabels": False,  # Hide bottom x-axis labels
+                **grid,
+            },
+            "xaxis2": {
+                "title": None,
+                "tickfont": {"size": FONT_SIZES["axis_label"], "color": COLORS["muted_text"]},
+                "tickangle": -45,
+                "side": "top",
+                "anchor": "y",
+                "overlaying": "x",
+                "fixedrange": True,
+                "showticklabels": True,
+                "tickmode": "array",
+                "tickvals": weeks,
+                "ticktext": weeks,
+                "range": [-0.5, len(weeks) - 0.5],
+                **grid,
+            },
+            "yaxis": {
+                "title": None,
+                "tickfont": {"size": FONT_SIZES["stock_axis_label"], "color": COLORS["muted_text"]},
+                "autorange": "reversed",
+                "tickmode": "linear",
+                "dtick": 1,
+                "fixedrange": True,
+                "ticklabelposition": "outside",
+                **grid,
+            },
+            "paper_bgcolor": COLORS["paper_bg"],
+            "plot_bgcolor": COLORS["plot_bg"],
+            "font": {"color": COLORS["text"]},
+            "height": chart_height,
+            "margin": {
+                "l": STOCK_MARGINS["left"],
+                "r": STOCK_MARGINS["right"],
+                "t": top_margin,
+                "b": bottom_margin,
+            },
+        },
+    }
+
+
+def limit_top_stocks(df: pd.DataFrame, value_col: str, top_n: Optional[int]) -> pd.DataFrame:
+    """
+    Keep only the top N stocks by mean percentile.
     
-    # Add grid lines
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor=COLORS["grid"])
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor=COLORS["grid"])
+    Row order (and therefore the selected sort) is preserved; only rows for
+    stocks outside the top N are dropped.
     
-    return fig
+    Args:
+        df: DataFrame with stock matrix data
+        value_col: Percentile column to rank by ('rs_percentile' or 'sctr_percentile')
+        top_n: Maximum number of stocks to keep (0/None keeps all)
+    
+    Returns:
+        Filtered DataFrame
+    """
+    if df.empty or not top_n:
+        return df
+    
+    values = pd.to_numeric(df[value_col], errors='coerce')
+    means = values.groupby(df['ticker'], observed=True, sort=False).mean()
+    if len(means) <= top_n:
+        return df
+    
+    top = means.nlargest(top_n).index
+    return df[df['ticker'].isin(top)]
+
+
+def downsample_price_data(df: pd.DataFrame, max_points: int = MAX_PRICE_POINTS) -> pd.DataFrame:
+    """
+    Merge consecutive price bars so a chart has at most max_points rows.
+    
+    Each bucket keeps the first open, highest high, lowest low and last close;
+    volume is summed and the date and indicator columns take the last value.
+    
+    Args:
+        df: DataFrame with OHLC data sorted by date
+        max_points: Maximum number of rows to return
+    
+    Returns:
+        DataFrame with at most max_points rows (df itself if already within)
+    """
+    if len(df) <= max_points:
+        return df
+    
+    buckets = np.arange(len(df)) * max_points // len(df)
+    agg = {col: 'last' for col in df.columns}
+    agg.update(open='first', high='max', low='min')
+    if 'volume' in df.columns:
+        agg['volume'] = 'sum'
+    
+    return df.groupby(buckets).agg(agg).reset_index(drop=True)
 
 
 def get_sctr_strength_label(percentile: float) -> str:
@@ -697,6 +807,9 @@ def create_price_rs_chart(df: pd.DataFrame, ticker: str, stock_name: str, timefr
         if d.weekday() < 5 and d.date() not in trading_dates:  # Weekday but not in data
             date_gaps.append(d)
     
+    # Bound the number of bars sent to the browser for long histories
+    df = downsample_price_data(df)
+    
     # Create figure with four subplots (Price, Volume, RS, RSI)
     fig = make_subplots(
         rows=4, cols=1,
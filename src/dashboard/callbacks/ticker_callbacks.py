@@ -7,19 +7,25 @@ Handles:
 - Price chart with RS indicator display
 """
 import logging
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 import pandas as pd
 import plotly.graph_objects as go
 from dash import callback, Input, Output, State, html, no_update, ctx
 import dash_bootstrap_components as dbc
+from sqlalchemy.orm import Session
 
-from src.models import SessionLocal, Stock
+from src.models import ScopedSession
 from src.services.data_service import (
-    get_stock_rs_matrix_data,
+    get_cached_stock_rs_matrix_data,
     get_subindustry_info,
+    get_stock_with_subindustry,
+    get_stock_name,
     get_stock_price_with_rs,
     get_stock_price_with_rs_weekly,
+    on_stock_rs_matrix_cache_clear,
 )
 from src.dashboard.callbacks.stock_callbacks import (
     create_stock_heatmap_figure,
@@ -30,6 +36,114 @@ from src.dashboard.utils.heatmap_config import COLORS
 
 logger = logging.getLogger(__name__)
 
+# Dark theme colors shared by every figure layout on this page
+_BASE_LAYOUT = dict(
+    paper_bgcolor=COLORS["paper_bg"],
+    plot_bgcolor=COLORS["plot_bg"],
+    font=dict(color=COLORS["text"]),
+)
+
+# Placeholder figure for empty and error states, built once and returned as a
+# plain dict so callbacks skip figure construction and validation
+_EMPTY_FIG = go.Figure()
+_EMPTY_FIG.update_layout(**_BASE_LAYOUT)
+_EMPTY_FIG_DICT = _EMPTY_FIG.to_dict()
+
+
+# Container styles returned by the callbacks
+_HIDDEN = {"display": "none"}
+_VISIBLE = {"display": "block"}
+_CHART_VISIBLE = {"display": "block", "marginTop": "2.5rem", "paddingTop": "1rem"}
+
+# Built heatmap figures keyed by (subindustry_code, num_weeks, sort_method),
+# each stored with the DataFrame it was built from so a refreshed RS matrix
+# invalidates it. Least recently used entries are evicted first. Callbacks
+# run on worker threads, so every access happens under the lock.
+_HEATMAP_FIGURE_CACHE_MAXSIZE = 32
+_heatmap_figure_cache: "OrderedDict[Tuple[str, int, str], Tuple[pd.DataFrame, dict]]" = OrderedDict()
+_heatmap_figure_lock = threading.Lock()
+
+
+def _get_cached_heatmap_figure(fig_key: Tuple[str, int, str], df: pd.DataFrame) -> Optional[dict]:
+    """Return the figure cached for fig_key if it was built from df, else None."""
+    with _heatmap_figure_lock:
+        cached = _heatmap_figure_cache.get(fig_key)
+        if cached is None or cached[0] is not df:
+            return None
+        _heatmap_figure_cache.move_to_end(fig_key)
+        return cached[1]
+
+
+def _cache_heatmap_figure(fig_key: Tuple[str, int, str], df: pd.DataFrame, fig: dict) -> None:
+    """Store a figure built from df, evicting the least recently used entry when full."""
+    with _heatmap_figure_lock:
+        _heatmap_figure_cache[fig_key] = (df, fig)
+        _heatmap_figure_cache.move_to_end(fig_key)
+        if len(_heatmap_figure_cache) > _HEATMAP_FIGURE_CACHE_MAXSIZE:
+            _heatmap_figure_cache.popitem(last=False)
+
+
+def clear_heatmap_figure_cache() -> None:
+    """Clear the heatmap figure cache (and the matrices its entries reference)."""
+    with _heatmap_figure_lock:
+        _heatmap_figure_cache.clear()
+
+
+# Entries can never match once their matrices are gone, so drop them together
+on_stock_rs_matrix_cache_clear(clear_heatmap_figure_cache)
+
+
+def _empty_figure(title: str, font_color: Optional[str] = None) -> dict:
+    """Return the placeholder figure dict with a title."""
+    layout = {**_EMPTY_FIG_DICT["layout"], "title": {"text": title}}
+    if font_color:
+        layout["font"] = {"color": font_color}
+    return {**_EMPTY_FIG_DICT, "layout": layout}
+
+
+def _load_price_data(db: Session, ticker: str, timeframe: str) -> pd.DataFrame:
+    """Get price and RS data for the chart timeframe."""
+    if timeframe == "weekly":
+        return get_stock_price_with_rs_weekly(db, ticker, num_weeks=104)
+    return get_stock_price_with_rs(db, ticker, num_weeks=52)
+
+
+def _detail_card(ticker: str, stock_name: str, week_label: Optional[str], percentile) -> dbc.Card:
+    """Build the selected stock card, with week and percentile info for heatmap clicks."""
+    detail_content = []
+    if week_label:
+        # Show week and percentile info
+        strength = get_strength_label(percentile) if percentile else "N/A"
+        detail_content = [
+            dbc.Row([
+                dbc.Col([
+                    html.P([
+                        html.Strong("Week: "),
+                        week_label
+                    ]),
+                ], md=4),
+                dbc.Col([
+                    html.P([
+                        html.Strong("RS Percentile: "),
+                        f"{percentile:.0f}" if percentile else "N/A"
+                    ]),
+                ], md=4),
+                dbc.Col([
+                    html.P([
+                        html.Strong("Strength: "),
+                        strength
+                    ]),
+                ], md=4),
+            ])
+        ]
+    
+    return dbc.Card([
+        dbc.CardHeader([
+            html.H5(f"📈 {ticker} - {stock_name}", className="mb-0")
+        ]),
+        dbc.CardBody(detail_content) if detail_content else None
+    ], className="bg-secondary")
+
 
 def register_ticker_callbacks(app):
     """Register all callbacks for the ticker searcher page."""
@@ -44,27 +158,16 @@ def register_ticker_callbacks(app):
         Output("ticker-chart-title", "children"),
         Output("ticker-price-rs-chart", "figure"),
         Output("ticker-selected-stock-store", "data"),
+        Output("ticker-detail-panel", "children"),
         Input("ticker-search-button", "n_clicks"),
         Input("ticker-search-input", "n_submit"),
         Input("ticker-search-value", "data"),
         State("ticker-search-input", "value"),
+        State("ticker-chart-timeframe-tabs", "active_tab"),
     )
-    def search_ticker(n_clicks, n_submit, initial_ticker, search_value):
+    def search_ticker(n_clicks, n_submit, initial_ticker, search_value, timeframe):
         """Handle ticker search and display initial results."""
         
-        # Hidden styles
-        hidden_style = {"display": "none"}
-        visible_style = {"display": "block"}
-        chart_visible_style = {"display": "block", "marginTop": "2.5rem", "paddingTop": "1rem"}
-        
-        # Empty figure for initial state
-        empty_fig = go.Figure()
-        empty_fig.update_layout(
-            paper_bgcolor=COLORS["paper_bg"],
-            plot_bgcolor=COLORS["plot_bg"],
-            font=dict(color=COLORS["text"]),
-        )
-        
         # Determine the ticker to search
         triggered_id = ctx.triggered_id if ctx.triggered_id else None
         
@@ -79,19 +182,20 @@ def register_ticker_callbacks(app):
             return (
                 html.P("Enter a ticker symbol above to search", className="text-muted"),
                 None,
-                hidden_style,
-                hidden_style,
-                hidden_style,
-                hidden_style,
+                _HIDDEN,
+                _HIDDEN,
+                _HIDDEN,
+                _HIDDEN,
                 "",
-                empty_fig,
-                None
+                _EMPTY_FIG_DICT,
+                None,
+                no_update
             )
         
         # Look up ticker in database
-        db = SessionLocal()
+        db = ScopedSession()
         try:
-            stock = db.query(Stock).filter(Stock.ticker == ticker).first()
+            stock, subindustry_info = get_stock_with_subindustry(db, ticker)
             
             if not stock:
                 return (
@@ -104,18 +208,17 @@ def register_ticker_callbacks(app):
                         className="mb-0"
                     ),
                     None,
-                    hidden_style,
-                    hidden_style,
-                    hidden_style,
-                    hidden_style,
+                    _HIDDEN,
+                    _HIDDEN,
+                    _HIDDEN,
+                    _HIDDEN,
                     "",
-                    empty_fig,
-                    None
+                    _EMPTY_FIG_DICT,
+                    None,
+                    no_update
                 )
             
-            # Get sub-industry info
             subindustry_code = stock.gics_subindustry_code
-            subindustry_info = get_subindustry_info(db, subindustry_code)
             
             if not subindustry_info:
                 return (
@@ -125,26 +228,30 @@ def register_ticker_callbacks(app):
                         className="mb-0"
                     ),
                     None,
-                    hidden_style,
-                    hidden_style,
-                    hidden_style,
-                    hidden_style,
+                    _HIDDEN,
+                    _HIDDEN,
+                    _HIDDEN,
+                    _HIDDEN,
                     "",
-                    empty_fig,
-                    None
+                    _EMPTY_FIG_DICT,
+                    None,
+                    no_update
                 )
             
             # Create success message with stock and sub-industry info
-            result_message = dbc.Card([
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
+            # (plain Divs with Bootstrap card/grid classes - same markup as
+            # dbc.Card/Row/Col with fewer components to build)
+            result_message = html.Div(
+                html.Div(
+                    html.Div([
+                        html.Div(
                             html.H4([
                                 html.I(className="fas fa-check-circle text-success me-2"),
                                 f"{stock.ticker} - {stock.name}"
                             ], className="mb-0"),
-                        ], md=6),
-                        dbc.Col([
+                            className="col-md-6",
+                        ),
+                        html.Div([
                             html.Div([
                                 html.Span("Sub-Industry: ", className="text-muted"),
                                 html.Strong(subindustry_info['name']),
@@ -153,29 +260,25 @@ def register_ticker_callbacks(app):
                                 html.Span("Sector: ", className="text-muted"),
                                 html.Strong(subindustry_info['sector_name']),
                             ]),
-                        ], md=6, className="text-md-end"),
-                    ], className="align-items-center")
-                ])
-            ], className="bg-secondary border-success")
-            
-            # Get price data for the initial chart display
-            price_df = get_stock_price_with_rs(db, ticker, num_weeks=52)
+                        ], className="col-md-6 text-md-end"),
+                    ], className="row align-items-center"),
+                    className="card-body",
+                ),
+                className="card bg-secondary border-success",
+            )
             
-            # Create initial chart for the searched ticker
-            chart_title = f"📊 {ticker} - {stock.name} | Daily Price & RS Indicator"
+            # Price chart for the searched ticker in the selected timeframe
+            timeframe = timeframe or "daily"
+            price_df = _load_price_data(db, ticker, timeframe)
+            timeframe_label = "Weekly" if timeframe == "weekly" else "Daily"
+            chart_title = f"📊 {ticker} - {stock.name} | {timeframe_label} Price & RS Indicator"
             
             if price_df.empty:
-                chart_fig = go.Figure()
-                chart_fig.update_layout(
-                    title=f"No price data available for {ticker}",
-                    paper_bgcolor=COLORS["paper_bg"],
-                    plot_bgcolor=COLORS["plot_bg"],
-                    font=dict(color=COLORS["text"]),
-                )
+                chart_fig = _empty_figure(f"No price data available for {ticker}")
             else:
-                chart_fig = create_price_rs_chart(price_df, ticker, stock.name, "daily")
+                chart_fig = create_price_rs_chart(price_df, ticker, stock.name, timeframe)
             
-            # Store selected stock data
+            # Store selected stock data for tab switching
             stock_store_data = {
                 "ticker": ticker,
                 "stock_name": stock.name,
@@ -186,13 +289,14 @@ def register_ticker_callbacks(app):
             return (
                 result_message,
                 subindustry_code,
-                visible_style,
-                visible_style,
-                visible_style,
-                chart_visible_style,
+                _VISIBLE,
+                _VISIBLE,
+                _VISIBLE,
+                _CHART_VISIBLE,
                 chart_title,
                 chart_fig,
-                stock_store_data
+                stock_store_data,
+                _detail_card(ticker, stock.name, None, None)
             )
             
         except Exception as e:
@@ -200,103 +304,93 @@ def register_ticker_callbacks(app):
             return (
                 dbc.Alert(f"Error: {str(e)}", color="danger", className="mb-0"),
                 None,
-                hidden_style,
-                hidden_style,
-                hidden_style,
-                hidden_style,
+                _HIDDEN,
+                _HIDDEN,
+                _HIDDEN,
+                _HIDDEN,
                 "",
-                empty_fig,
-                None
+                _EMPTY_FIG_DICT,
+                None,
+                no_update
             )
-        finally:
-            db.close()
     
     @app.callback(
         Output("ticker-rs-heatmap", "figure"),
         Output("ticker-data-stats", "children"),
+        Output("ticker-heatmap-last-key", "data"),
         Input("ticker-subindustry-code", "data"),
         Input("ticker-sort-method", "value"),
         Input("ticker-weeks-slider", "value"),
+        State("ticker-heatmap-last-key", "data"),
+        prevent_initial_call=True
     )
     def update_ticker_heatmap(
         subindustry_code: Optional[str],
         sort_method: str,
-        num_weeks: int
+        num_weeks: int,
+        last_key: Optional[list]
     ):
         """Generate and update the sub-industry heatmap for the found ticker."""
         
         if not subindustry_code:
-            empty_fig = go.Figure()
-            empty_fig.update_layout(
-                paper_bgcolor=COLORS["paper_bg"],
-                plot_bgcolor=COLORS["plot_bg"],
-                font=dict(color=COLORS["text"]),
-            )
-            return empty_fig, ""
+            return _EMPTY_FIG_DICT, "", None
         
-        db = SessionLocal()
+        # Same heatmap as the one already shown (e.g. radio re-click or a new
+        # search within the same sub-industry), nothing to send
+        key = [subindustry_code, sort_method, num_weeks]
+        if key == last_key:
+            return no_update, no_update, no_update
+        
+        db = ScopedSession()
         try:
             # Get sub-industry info for title
             subindustry_info = get_subindustry_info(db, subindustry_code)
             
             if not subindustry_info:
-                empty_fig = go.Figure()
-                empty_fig.update_layout(
-                    title=f"Sub-industry {subindustry_code} not found",
-                    paper_bgcolor=COLORS["paper_bg"],
-                    plot_bgcolor=COLORS["plot_bg"],
-                    font=dict(color=COLORS["text"]),
-                )
-                return empty_fig, ""
+                return _empty_figure(f"Sub-industry {subindustry_code} not found"), "", None
             
-            # Get stock RS data
-            df = get_stock_rs_matrix_data(
+            # Get stock RS data (cached per sub-industry, sort and weeks).
+            # The frame is shared with other callers and is only read here.
+            df = get_cached_stock_rs_matrix_data(
                 db=db,
                 subindustry_code=subindustry_code,
                 num_weeks=num_weeks,
                 sort_by=sort_method
             )
             
-            # Stats
-            stock_count = df['ticker'].nunique() if not df.empty else 0
-            stats_text = f"{subindustry_info['name']} | Showing {stock_count} stocks | {num_weeks} weeks"
-            
             if df.empty:
-                empty_fig = go.Figure()
-                empty_fig.update_layout(
-                    title="No stock RS data available for this sub-industry",
-                    paper_bgcolor=COLORS["paper_bg"],
-                    plot_bgcolor=COLORS["plot_bg"],
-                    font=dict(color=COLORS["text"]),
-                )
-                return empty_fig, stats_text
+                stats_text = f"{subindustry_info['name']} | Showing 0 stocks | {num_weeks} weeks"
+                return _empty_figure("No stock RS data available for this sub-industry"), stats_text, key
             
-            # Create heatmap figure using the same function as stock page
-            fig = create_stock_heatmap_figure(df, num_weeks)
+            # Create heatmap figure using the same function as stock page,
+            # reusing the last build if the matrix hasn't changed
+            fig_key = (subindustry_code, num_weeks, sort_method)
+            base_fig = _get_cached_heatmap_figure(fig_key, df)
+            if base_fig is None:
+                base_fig = create_stock_heatmap_figure(df)
+                _cache_heatmap_figure(fig_key, df, base_fig)
             
-            # Update title to show sub-industry name
-            fig.update_layout(
-                title=dict(
-                    text=f"{subindustry_info['name']} Stocks<br><sup>← Most Recent | Weeks | Older →</sup>",
-                )
-            )
+            # Stats - the heatmap has one row per stock, so count its rows
+            # instead of hashing every ticker in the matrix
+            stock_count = len(base_fig["data"][0]["y"])
+            stats_text = f"{subindustry_info['name']} | Showing {stock_count} stocks | {num_weeks} weeks"
+            
+            # Update title to show sub-industry name (on a copy, the cached
+            # figure is shared)
+            title = {
+                **base_fig["layout"]["title"],
+                "text": f"{subindustry_info['name']} Stocks<br><sup>← Most Recent | Weeks | Older →</sup>",
+            }
+            fig = {**base_fig, "layout": {**base_fig["layout"], "title": title}}
             
-            return fig, stats_text
+            return fig, stats_text, key
             
         except Exception as e:
             logger.exception(f"Error updating ticker heatmap: {e}")
-            error_fig = go.Figure()
-            error_fig.update_layout(
-                title=f"Error loading data: {str(e)}",
-                paper_bgcolor=COLORS["paper_bg"],
-                font=dict(color="#ef4444"),
-            )
-            return error_fig, "Error loading data"
-        finally:
-            db.close()
+            return _empty_figure(f"Error loading data: {str(e)}", font_color="#ef4444"), "Error loading data", None
     
     @app.callback(
-        Output("ticker-detail-panel", "children"),
+        Output("ticker-detail-panel", "children", allow_duplicate=True),
         Output("ticker-chart-container", "style", allow_duplicate=True),
         Output("ticker-price-rs-chart", "figure", allow_duplicate=True),
         Output("ticker-chart-title", "children", allow_duplicate=True),
@@ -309,18 +403,6 @@ def register_ticker_callbacks(app):
     def show_ticker_detail_panel(click_data, timeframe, stored_stock):
         """Show price chart with RS indicator when any stock cell is clicked or timeframe changes."""
         
-        # Styles
-        hidden_style = {"display": "none"}
-        visible_style = {"display": "block", "marginTop": "2.5rem", "paddingTop": "1rem"}
-        
-        # Empty figure for initial state
-        empty_fig = go.Figure()
-        empty_fig.update_layout(
-            paper_bgcolor=COLORS["paper_bg"],
-            plot_bgcolor=COLORS["plot_bg"],
-            font=dict(color=COLORS["text"]),
-        )
-        
         # Default timeframe if not set
         if not timeframe:
             timeframe = "daily"
@@ -341,13 +423,9 @@ def register_ticker_callbacks(app):
             week_label = point['x']
             percentile = point.get('z')
             
-            # Get stock name from database
-            db = SessionLocal()
-            try:
-                stock = db.query(Stock).filter(Stock.ticker == ticker).first()
-                stock_name = stock.name if stock else ticker
-            finally:
-                db.close()
+            # Stock name is looked up below (cached, so repeat clicks skip
+            # the database)
+            stock_name = None
         elif stored_stock:
             # Use stored stock for initial load
             ticker = stored_stock.get("ticker")
@@ -368,6 +446,12 @@ def register_ticker_callbacks(app):
             )
         
         try:
+            # Get stock name (for clicks) and price data in one session
+            db = ScopedSession()
+            if stock_name is None:
+                stock_name = get_stock_name(db, ticker) or ticker
+            price_df = _load_price_data(db, ticker, timeframe)
+            
             # Store the selected stock for tab switching
             stock_store_data = {
                 "ticker": ticker,
@@ -376,77 +460,27 @@ def register_ticker_callbacks(app):
                 "percentile": percentile,
             }
             
-            # Get price data from database
-            db = SessionLocal()
-            try:
-                # Choose data based on timeframe
-                if timeframe == "weekly":
-                    price_df = get_stock_price_with_rs_weekly(db, ticker, num_weeks=104)
-                else:
-                    price_df = get_stock_price_with_rs(db, ticker, num_weeks=52)
-            finally:
-                db.close()
-            
             # Chart title with timeframe indicator
             timeframe_label = "Weekly" if timeframe == "weekly" else "Daily"
             chart_title = f"📊 {ticker} - {stock_name} | {timeframe_label} Price & RS Indicator"
             
-            # Show week and percentile info
-            strength = get_strength_label(percentile) if percentile else "N/A"
-            
-            detail_content = []
-            if week_label:
-                detail_content = [
-                    dbc.Row([
-                        dbc.Col([
-                            html.P([
-                                html.Strong("Week: "),
-                                week_label
-                            ]),
-                        ], md=4),
-                        dbc.Col([
-                            html.P([
-                                html.Strong("RS Percentile: "),
-                                f"{percentile:.0f}" if percentile else "N/A"
-                            ]),
-                        ], md=4),
-                        dbc.Col([
-                            html.P([
-                                html.Strong("Strength: "),
-                                strength
-                            ]),
-                        ], md=4),
-                    ])
-                ]
-            
-            detail_card = dbc.Card([
-                dbc.CardHeader([
-                    html.H5(f"📈 {ticker} - {stock_name}", className="mb-0")
-                ]),
-                dbc.CardBody(detail_content) if detail_content else None
-            ], className="bg-secondary")
+            detail_card = _detail_card(ticker, stock_name, week_label, percentile)
             
             # Create the price + RS chart
             if price_df.empty:
-                error_fig = go.Figure()
-                error_fig.update_layout(
-                    title=f"No price data available for {ticker}",
-                    paper_bgcolor=COLORS["paper_bg"],
-                    plot_bgcolor=COLORS["plot_bg"],
-                    font=dict(color=COLORS["text"]),
-                )
-                return detail_card, visible_style, error_fig, chart_title, stock_store_data
+                error_fig = _empty_figure(f"No price data available for {ticker}")
+                return detail_card, _CHART_VISIBLE, error_fig, chart_title, stock_store_data
             
             fig = create_price_rs_chart(price_df, ticker, stock_name, timeframe)
             
-            return detail_card, visible_style, fig, chart_title, stock_store_data
+            return detail_card, _CHART_VISIBLE, fig, chart_title, stock_store_data
             
         except Exception as e:
             logger.exception(f"Error showing ticker detail panel: {e}")
             return (
                 html.P(f"Error: {str(e)}", className="text-danger"),
-                hidden_style,
-                empty_fig,
+                _HIDDEN,
+                _EMPTY_FIG_DICT,
                 "",
                 no_update
             )
@@ -0,0 +1,24 @@
+"""
+Bootstrap class names shared by the dashboard page layouts.
+"""
+
+# Page structure
+PAGE_CONTAINER = "bg-dark text-light min-vh-100 pb-4"
+PAGE_TITLE = "text-center mt-4 mb-2"
+PAGE_SUBTITLE = "text-center text-muted mb-4"
+BACK_ICON = "fas fa-arrow-left me-2"
+STATS_FOOTER = "text-center text-muted mt-4 mb-3 small"
+
+# Filter controls
+CONTROL_BAR = "mb-4 p-3 bg-dark rounded"
+CONTROL_LABEL = "fw-bold mb-1"
+
+# Color legend
+LEGEND = "text-center my-3"
+LEGEND_ITEM = "mx-3"
+
+# Detail panel and chart sections
+INFO_PANEL = "p-3 bg-dark border border-secondary rounded"
+INFO_PANEL_PLACEHOLDER = "text-muted text-center mb-0"
+CHART_SECTION = "mt-5 pt-3"
+SECTION_TITLE = "text-center mb-3"
@@ -0,0 +1,54 @@
+"""
+Component props shared by the dashboard page layouts (treat as read-only).
+"""
+from src.dashboard.utils.heatmap_config import MAX_INDUSTRY_WEEKS, MAX_STOCK_WEEKS
+
+# Full-screen overlay shown until the first callback completes
+LOADING_OVERLAY_STYLE = {
+    "position": "fixed",
+    "top": 0,
+    "left": 0,
+    "width": "100%",
+    "height": "100%",
+    "backgroundColor": "#0f172a",
+    "zIndex": 9999,
+    "display": "block"
+}
+
+# Stock heatmap sort options
+SORT_OPTIONS = [
+    {"label": " Latest RS", "value": "latest"},
+    {"label": " 4W Change", "value": "change"},
+    {"label": " A-Z", "value": "alpha"},
+]
+
+
+def _weeks_marks(max_weeks: int) -> dict:
+    """Weeks slider marks, ending at the slider maximum."""
+    marks = {weeks: f'{weeks}w' for weeks in (4, 8, 13, 17)}
+    marks[max_weeks] = f'{max_weeks}w'
+    return marks
+
+
+# Weeks slider marks for the stock heatmaps and the main page heatmaps
+STOCK_WEEKS_MARKS = _weeks_marks(MAX_STOCK_WEEKS)
+INDUSTRY_WEEKS_MARKS = _weeks_marks(MAX_INDUSTRY_WEEKS)
+
+# Graph configs
+HEATMAP_GRAPH_CONFIG = {
+    "displayModeBar": True,
+    "scrollZoom": False,
+    "displaylogo": False,
+    "modeBarButtonsToRemove": [
+        "select2d", "lasso2d", "autoScale2d", "zoomOut2d"
+    ],
+}
+
+CHART_GRAPH_CONFIG = {
+    "displayModeBar": True,
+    "scrollZoom": True,
+    "displaylogo": False,
+    "modeBarButtonsToRemove": [
+        "select2d", "lasso2d"
+    ],
+}
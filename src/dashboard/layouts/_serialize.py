@@ -0,0 +1,28 @@
+"""
+Helpers for pre-serializing static layout sections.
+"""
+from dash.development.base_component import Component
+
+
+def to_plotly_json(value):
+    """
+    Recursively convert Dash components to the plain dicts Dash sends to the browser.
+
+    Layout sections converted once can be shared across requests, so the JSON
+    encoder writes plain dicts instead of walking every component again.
+
+    Args:
+        value: Component, list/tuple of components, or a plain prop value
+
+    Returns:
+        The same structure with every component replaced by its JSON dict
+    """
+    if isinstance(value, Component):
+        component_json = value.to_plotly_json()
+        component_json["props"] = {
+            name: to_plotly_json(prop) for name, prop in component_json["props"].items()
+        }
+        return component_json
+    if isinstance(value, (list, tuple)):
+        return [to_plotly_json(item) for item in value]
+    return value
@@ -7,92 +7,137 @@ Defines the structure of the RS Dashboard including:
 - Heatmap
 - Detail panel
 """
+from functools import lru_cache
+
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
+from src.dashboard.layouts import _classnames as cn
+from src.dashboard.layouts import _props as props
+from src.dashboard.layouts._serialize import to_plotly_json
+from src.dashboard.utils.heatmap_config import MAX_INDUSTRY_WEEKS
+
+
+def _loading_overlay():
+    """Initial loading overlay shown before the first callback completes."""
+    return html.Div(
+        id="initial-loading-overlay",
+        children=[
+            html.Div([
+                html.Div([
+                    html.H2("📊 RS Industry Dashboard", className="text-light mb-4"),
+                    html.Div([
+                        dbc.Spinner(color="success", size="lg", spinner_class_name="me-3"),
+                        html.Span("Loading data...", className="text-light fs-5"),
+                    ], className="d-flex align-items-center justify-content-center mb-4"),
+                    dbc.Progress(
+                        value=100,
+                        animated=True,
+                        striped=True,
+                        color="success",
+                        style={"height": "6px", "width": "350px"},
+                        className="mb-3"
+                    ),
+                    html.P("Fetching RS data for 127 sub-industries...", 
+                           className="text-muted small mb-0"),
+                ], className="text-center")
+            ], className="d-flex align-items-center justify-content-center", 
+               style={"minHeight": "100vh"})
+        ],
+        style=props.LOADING_OVERLAY_STYLE
+    )
+
+
+def _header():
+    """Page header with the Ticker Searcher button."""
+    return dbc.Row([
+        dbc.Col([
+            html.Div([
+                # Ticker Searcher button (positioned at top right)
+                html.A(
+                    [html.I(className="fas fa-search me-2"), "Ticker Searcher"],
+                    href="/dashboard/ticker/",
+                    className="btn btn-primary btn-sm",
+                    style={
+                        "position": "absolute",
+                        "top": "1rem",
+                        "right": "1rem",
+                        "zIndex": 10000,
+                        "textDecoration": "none"
+                    }
+                ),
+                
+                html.H1(
+                    id="main-page-title",
+                    children="📊 Industry Dashboard",
+                    className=cn.PAGE_TITLE
+                ),
+                html.P(
+                    id="main-page-subtitle",
+                    children="GICS Sub-Industry Analysis | Weekly",
+                    className=cn.PAGE_SUBTITLE
+                ),
+            ], className="position-relative")
+        ])
+    ])
+
 
+def _color_legend():
+    """Color legend row (children are replaced by the RS/SCTR tab callback)."""
+    return dbc.Row([
+        dbc.Col([
+            html.Div(
+                id="color-legend",
+                children=[
+                    html.Span("🔴 Weak (Bottom 33%)", className=cn.LEGEND_ITEM),
+                    html.Span("🟡 Neutral (Middle 34%)", className=cn.LEGEND_ITEM),
+                    html.Span("🟢 Strong (Top 33%)", className=cn.LEGEND_ITEM),
+                ],
+                className=cn.LEGEND
+            )
+        ])
+    ])
+
+
+def _detail_panel():
+    """Detail panel placeholder (children are replaced on cell click)."""
+    return dbc.Row([
+        dbc.Col([
+            html.Div(
+                id="detail-panel",
+                className=cn.INFO_PANEL,
+                children=[
+                    html.P(
+                        "📈 Click chart icon to see sector ETF | Click cell to drill down to stocks",
+                        className=cn.INFO_PANEL_PLACEHOLDER
+                    )
+                ]
+            )
+        ])
+    ], className="mt-4")
+
+
+# The layout is static, so build and serialize it once and reuse it
+@lru_cache(maxsize=1)
 def create_layout():
     """
     Create the main dashboard layout.
     
     Returns:
-        Dash layout component
+        Dash layout as the plain JSON dict sent to the browser
     """
-    return dbc.Container([
+    return to_plotly_json(dbc.Container([
         # Initial Loading Overlay (shown before first callback completes)
-        html.Div(
-            id="initial-loading-overlay",
-            children=[
-                html.Div([
-                    html.Div([
-                        html.H2("📊 RS Industry Dashboard", className="text-light mb-4"),
-                        html.Div([
-                            dbc.Spinner(color="success", size="lg", spinner_class_name="me-3"),
-                            html.Span("Loading data...", className="text-light fs-5"),
-                        ], className="d-flex align-items-center justify-content-center mb-4"),
-                        dbc.Progress(
-                            value=100,
-                            animated=True,
-                            striped=True,
-                            color="success",
-                            style={"height": "6px", "width": "350px"},
-                            className="mb-3"
-                        ),
-                        html.P("Fetching RS data for 127 sub-industries...", 
-                               className="text-muted small mb-0"),
-                    ], className="text-center")
-                ], className="d-flex align-items-center justify-content-center", 
-                   style={"minHeight": "100vh"})
-            ],
-            style={
-                "position": "fixed",
-                "top": 0,
-                "left": 0,
-                "width": "100%",
-                "height": "100%",
-                "backgroundColor": "#0f172a",
-                "zIndex": 9999,
-                "display": "block"
-            }
-        ),
+        _loading_overlay(),
         
         # Header with Ticker Searcher button
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    # Ticker Searcher button (positioned at top right)
-                    html.A(
-                        [html.I(className="fas fa-search me-2"), "Ticker Searcher"],
-                        href="/dashboard/ticker/",
-                        className="btn btn-primary btn-sm",
-                        style={
-                            "position": "absolute",
-                            "top": "1rem",
-                            "right": "1rem",
-                            "zIndex": 10000,
-                            "textDecoration": "none"
-                        }
-                    ),
-                    
-                    html.H1(
-                        id="main-page-title",
-                        children="📊 Industry Dashboard",
-                        className="text-center mt-4 mb-2"
-                    ),
-                    html.P(
-                        id="main-page-subtitle",
-                        children="GICS Sub-Industry Analysis | Weekly",
-                        className="text-center text-muted mb-4"
-                    ),
-                ], className="position-relative")
-            ])
-        ]),
+        _header(),
         
         # Filter Controls Row
         dbc.Row([
             # Sector Filter
             dbc.Col([
-                html.Label("Filter by Sector:", className="fw-bold mb-1"),
+                html.Label("Filter by Sector:", className=cn.CONTROL_LABEL),
                 dcc.Dropdown(
                     id="sector-filter",
                     options=[],  # Populated by callback
@@ -105,7 +150,7 @@ def create_layout():
             
             # Sort Method
             dbc.Col([
-                html.Label("Sort By:", className="fw-bold mb-1"),
+                html.Label("Sort By:", className=cn.CONTROL_LABEL),
                 dbc.RadioItems(
                     id="sort-method",
                     options=[
@@ -122,24 +167,20 @@ def create_layout():
             
             # Weeks Slider
             dbc.Col([
-                html.Label("Weeks to Display:", className="fw-bold mb-1"),
+                html.Label("Weeks to Display:", className=cn.CONTROL_LABEL),
                 dcc.Slider(
                     id="weeks-slider",
                     min=4,
-                    max=26,
+                    max=MAX_INDUSTRY_WEEKS,
                     step=1,
                     value=17,
-                    marks={
-                        4: '4w',
-                        8: '8w',
-                        13: '13w',
-                        17: '17w',
-                        26: '26w'
-                    },
+                    marks=props.INDUSTRY_WEEKS_MARKS,
                     tooltip={"placement": "bottom", "always_visible": False},
+                    # Only fire the heatmap callback when the drag is released
+                    updatemode="mouseup",
                 ),
             ], md=4),
-        ], className="mb-4 p-3 bg-dark rounded"),
+        ], className=cn.CONTROL_BAR),
         
         # Metric Toggle Tabs (RS vs SCTR)
         dbc.Row([
@@ -178,14 +219,7 @@ def create_layout():
                     children=[
                         dcc.Graph(
                             id="sector-heatmap",
-                            config={
-                                "displayModeBar": True,
-                                "scrollZoom": False,
-                                "displaylogo": False,
-                                "modeBarButtonsToRemove": [
-                                    "select2d", "lasso2d", "autoScale2d", "zoomOut2d"
-                                ],
-                            },
+                            config=props.HEATMAP_GRAPH_CONFIG,
                         )
                     ]
                 )
@@ -232,14 +266,7 @@ def create_layout():
                             children=[
                                 dcc.Graph(
                                     id="rs-heatmap",
-                                    config={
-                                        "displayModeBar": True,
-                                        "scrollZoom": False,
-                                        "displaylogo": False,
-                                        "modeBarButtonsToRemove": [
-                                            "select2d", "lasso2d", "autoScale2d", "zoomOut2d"
-                                        ],
-                                    },
+                                    config=props.HEATMAP_GRAPH_CONFIG,
                                     # Height is controlled by the figure layout
                                 )
                             ]
@@ -250,47 +277,22 @@ def create_layout():
         ]),
         
         # Color Legend (dynamic based on RS/SCTR tab)
-        dbc.Row([
-            dbc.Col([
-                html.Div(
-                    id="color-legend",
-                    children=[
-                        html.Span("🔴 Weak (Bottom 33%)", className="mx-3"),
-                        html.Span("🟡 Neutral (Middle 34%)", className="mx-3"),
-                        html.Span("🟢 Strong (Top 33%)", className="mx-3"),
-                    ],
-                    className="text-center my-3"
-                )
-            ])
-        ]),
+        _color_legend(),
         
         # Detail Panel (shown on cell click)
-        dbc.Row([
-            dbc.Col([
-                html.Div(
-                    id="detail-panel",
-                    className="p-3 bg-dark border border-secondary rounded",
-                    children=[
-                        html.P(
-                            "📈 Click chart icon to see sector ETF | Click cell to drill down to stocks",
-                            className="text-muted text-center mb-0"
-                        )
-                    ]
-                )
-            ])
-        ], className="mt-4"),
+        _detail_panel(),
         
         # TradingView Chart Container (shown on cell click)
         dbc.Row([
             dbc.Col([
                 html.Div(
                     id="tradingview-container",
-                    className="mt-5 pt-3",  # Increased margin for clear separation
+                    className=cn.CHART_SECTION,  # Increased margin for clear separation
                     style={"display": "none"},
                     children=[
                         html.H5(
                             id="tradingview-title",
-                            className="text-center mb-3"
+                            className=cn.SECTION_TITLE
                         ),
                         html.Iframe(
                             id="tradingview-iframe",
@@ -312,7 +314,7 @@ def create_layout():
             dbc.Col([
                 html.Div(
                     id="data-stats",
-                    className="text-center text-muted mt-4 mb-3 small"
+                    className=cn.STATS_FOOTER
                 )
             ])
         ]),
@@ -323,5 +325,4 @@ def create_layout():
         dcc.Store(id="selected-cell-store"),
         dcc.Store(id="sector-click-filter-store"),  # Store for sector filter from heatmap click
         
-    ], fluid=True, className="bg-dark text-light min-vh-100 pb-4")
-
+    ], fluid=True, className=cn.PAGE_CONTAINER))
@@ -4,24 +4,21 @@ Stock drilldown page layout.
 Displays individual stock RS heatmap for a specific GICS sub-industry.
 Similar structure to main layout but focused on individual stocks.
 """
+from functools import lru_cache
+
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
+from src.dashboard.layouts import _classnames as cn
+from src.dashboard.layouts import _props as props
+from src.dashboard.layouts._serialize import to_plotly_json
+from src.dashboard.utils.heatmap_config import MAX_STOCK_ROWS, MAX_STOCK_WEEKS
 
-def create_layout(subindustry_code: str = None):
-    """
-    Create the stock drilldown page layout.
-    
-    Args:
-        subindustry_code: GICS sub-industry code to display stocks for
-    
-    Returns:
-        Dash layout component
-    """
-    return dbc.Container([
-        # Store the subindustry code for callbacks
-        dcc.Store(id="stock-subindustry-code", data=subindustry_code),
-        
+
+@lru_cache(maxsize=1)
+def _page_sections() -> tuple:
+    """Build every section of the page except the sub-industry store, pre-serialized."""
+    return tuple(to_plotly_json([
         # Initial Loading Overlay
         html.Div(
             id="stock-loading-overlay",
@@ -45,16 +42,7 @@ def create_layout(subindustry_code: str = None):
                 ], className="d-flex align-items-center justify-content-center", 
                    style={"minHeight": "100vh"})
             ],
-            style={
-                "position": "fixed",
-                "top": 0,
-                "left": 0,
-                "width": "100%",
-                "height": "100%",
-                "backgroundColor": "#0f172a",
-                "zIndex": 9999,
-                "display": "block"
-            }
+            style=props.LOADING_OVERLAY_STYLE
         ),
         
         # Header with Back Button
@@ -64,7 +52,7 @@ def create_layout(subindustry_code: str = None):
                     # Back button (positioned absolutely)
                     dcc.Link(
                         dbc.Button(
-                            [html.I(className="fas fa-arrow-left me-2"), "Back to Main"],
+                            [html.I(className=cn.BACK_ICON), "Back to Main"],
                             id="back-button",
                             color="secondary",
                             size="sm",
@@ -83,12 +71,12 @@ def create_layout(subindustry_code: str = None):
                     html.H1(
                         id="stock-page-title",
                         children="📈 Stock RS Heatmap",
-                        className="text-center mt-4 mb-2"
+                        className=cn.PAGE_TITLE
                     ),
                     html.P(
                         id="stock-page-subtitle",
                         children="Individual Stock Relative Strength | Click stock for TradingView chart",
-                        className="text-center text-muted mb-4"
+                        className=cn.PAGE_SUBTITLE
                     ),
                 ], className="position-relative")
             ])
@@ -98,40 +86,47 @@ def create_layout(subindustry_code: str = None):
         dbc.Row([
             # Sort Method
             dbc.Col([
-                html.Label("Sort By:", className="fw-bold mb-1"),
+                html.Label("Sort By:", className=cn.CONTROL_LABEL),
                 dbc.RadioItems(
                     id="stock-sort-method",
+                    options=props.SORT_OPTIONS,
+                    value="latest",
+                    inline=True,
+                    className="mb-3"
+                ),
+            ], md=4),
+            
+            # Row limit (large sub-industries are trimmed to the top N stocks)
+            dbc.Col([
+                html.Label("Stocks to Display:", className=cn.CONTROL_LABEL),
+                dbc.RadioItems(
+                    id="stock-top-n",
                     options=[
-                        {"label": " Latest RS", "value": "latest"},
-                        {"label": " 4W Change", "value": "change"},
-                        {"label": " A-Z", "value": "alpha"},
+                        {"label": " Top 50", "value": 50},
+                        {"label": " Top 100", "value": 100},
+                        {"label": " Top 200", "value": MAX_STOCK_ROWS},
+                        {"label": " All", "value": 0},
                     ],
-                    value="latest",
+                    value=MAX_STOCK_ROWS,
                     inline=True,
                     className="mb-3"
                 ),
-            ], md=6),
+            ], md=4),
             
             # Weeks Slider
             dbc.Col([
-                html.Label("Weeks to Display:", className="fw-bold mb-1"),
+                html.Label("Weeks to Display:", className=cn.CONTROL_LABEL),
                 dcc.Slider(
                     id="stock-weeks-slider",
                     min=4,
-                    max=26,
+                    max=MAX_STOCK_WEEKS,
                     step=1,
                     value=17,
-                    marks={
-                        4: '4w',
-                        8: '8w',
-                        13: '13w',
-                        17: '17w',
-                        26: '26w'
-                    },
+                    marks=props.STOCK_WEEKS_MARKS,
                     tooltip={"placement": "bottom", "always_visible": False},
                 ),
-            ], md=6),
-        ], className="mb-4 p-3 bg-dark rounded"),
+            ], md=4),
+        ], className=cn.CONTROL_BAR),
         
         # Metric Toggle Tabs (RS vs SCTR)
         dbc.Row([
@@ -177,14 +172,7 @@ def create_layout(subindustry_code: str = None):
                             children=[
                                 dcc.Graph(
                                     id="stock-rs-heatmap",
-                                    config={
-                                        "displayModeBar": True,
-                                        "scrollZoom": False,
-                                        "displaylogo": False,
-                                        "modeBarButtonsToRemove": [
-                                            "select2d", "lasso2d", "autoScale2d", "zoomOut2d"
-                                        ],
-                                    },
+                                    config=props.HEATMAP_GRAPH_CONFIG,
                                     # Height is controlled by the figure layout
                                 )
                             ]
@@ -200,11 +188,11 @@ def create_layout(subindustry_code: str = None):
                 html.Div(
                     id="stock-color-legend",
                     children=[
-                        html.Span("🔴 Weak (Bottom 33%)", className="mx-3"),
-                        html.Span("🟡 Neutral (Middle 34%)", className="mx-3"),
-                        html.Span("🟢 Strong (Top 33%)", className="mx-3"),
+                        html.Span("🔴 Weak (Bottom 33%)", className=cn.LEGEND_ITEM),
+                        html.Span("🟡 Neutral (Middle 34%)", className=cn.LEGEND_ITEM),
+                        html.Span("🟢 Strong (Top 33%)", className=cn.LEGEND_ITEM),
                     ],
-                    className="text-center my-3"
+                    className=cn.LEGEND
                 )
             ])
         ]),
@@ -214,11 +202,11 @@ def create_layout(subindustry_code: str = None):
             dbc.Col([
                 html.Div(
                     id="stock-detail-panel",
-                    className="p-3 bg-dark border border-secondary rounded",
+                    className=cn.INFO_PANEL,
                     children=[
                         html.P(
                             "Click on a stock to see TradingView chart",
-                            className="text-muted text-center mb-0"
+                            className=cn.INFO_PANEL_PLACEHOLDER
                         )
                     ]
                 )
@@ -230,12 +218,12 @@ def create_layout(subindustry_code: str = None):
             dbc.Col([
                 html.Div(
                     id="stock-chart-container",
-                    className="mt-5 pt-3",
+                    className=cn.CHART_SECTION,
                     style={"display": "none"},
                     children=[
                         html.H5(
                             id="stock-chart-title",
-                            className="text-center mb-3"
+                            className=cn.SECTION_TITLE
                         ),
                         # Daily/Weekly timeframe tabs
                         dbc.Tabs(
@@ -254,14 +242,7 @@ def create_layout(subindustry_code: str = None):
                             children=[
                                 dcc.Graph(
                                     id="stock-price-rs-chart",
-                                    config={
-                                        "displayModeBar": True,
-                                        "scrollZoom": True,
-                                        "displaylogo": False,
-                                        "modeBarButtonsToRemove": [
-                                            "select2d", "lasso2d"
-                                        ],
-                                    },
+                                    config=props.CHART_GRAPH_CONFIG,
                                     style={
                                         "height": "1000px",  # Increased for 4 subplots (Price, Volume, RS, RSI)
                                         "border": "1px solid #334155",
@@ -280,7 +261,7 @@ def create_layout(subindustry_code: str = None):
             dbc.Col([
                 html.Div(
                     id="stock-data-stats",
-                    className="text-center text-muted mt-4 mb-3 small"
+                    className=cn.STATS_FOOTER
                 )
             ])
         ]),
@@ -288,5 +269,33 @@ def create_layout(subindustry_code: str = None):
         # Hidden store for selected stock info (used for tab switching)
         dcc.Store(id="selected-stock-store"),
         
-    ], fluid=True, className="bg-dark text-light min-vh-100 pb-4")
+        # Ticker -> stock name map for the current heatmap (used on cell click)
+        dcc.Store(id="stock-name-map"),
+        
+        # Full-range heatmap figure; the weeks slider slices it client-side
+        dcc.Store(id="stock-heatmap-figure-store"),
+        
+        # Heatmap stats; the week count is filled in client-side from the slider
+        dcc.Store(id="stock-stats-store"),
+    ]))
+
+
+def create_layout(subindustry_code: str = None):
+    """
+    Create the stock drilldown page layout.
+    
+    Only the sub-industry store is built per call; the rest of the page is
+    built once and shared.
+    
+    Args:
+        subindustry_code: GICS sub-industry code to display stocks for
+    
+    Returns:
+        Dash layout as the plain JSON dict sent to the browser
+    """
+    return to_plotly_json(dbc.Container([
+        # Store the subindustry code for callbacks
+        dcc.Store(id="stock-subindustry-code", data=subindustry_code),
+        *_page_sections(),
+    ], fluid=True, className=cn.PAGE_CONTAINER))
 
@@ -5,25 +5,25 @@ Allows searching by ticker to find its sub-industry and display:
 - Sub-industry RS heatmap for all stocks in that sub-industry
 - Daily/Weekly price chart with RS indicator for the searched ticker
 """
+from functools import lru_cache
+
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
+from src.dashboard.layouts import _classnames as cn
+from src.dashboard.layouts import _props as props
+from src.dashboard.layouts._serialize import to_plotly_json
+from src.dashboard.utils.heatmap_config import MAX_STOCK_WEEKS
 
-def create_layout(ticker: str = None):
-    """
-    Create the ticker searcher page layout.
-    
-    Args:
-        ticker: Optional initial ticker to search for
-    
-    Returns:
-        Dash layout component
-    """
-    return dbc.Container([
-        # Store the ticker for callbacks
-        dcc.Store(id="ticker-search-value", data=ticker),
+
+@lru_cache(maxsize=1)
+def _header_sections() -> tuple:
+    """Build the static stores and page header, pre-serialized."""
+    return tuple(to_plotly_json([
         dcc.Store(id="ticker-subindustry-code", data=None),
         dcc.Store(id="ticker-selected-stock-store", data=None),
+        # (subindustry_code, sort_method, num_weeks) of the heatmap currently shown
+        dcc.Store(id="ticker-heatmap-last-key", data=None),
         
         # Header with Back Button
         dbc.Row([
@@ -32,7 +32,7 @@ def create_layout(ticker: str = None):
                     # Back button (positioned absolutely)
                     dcc.Link(
                         dbc.Button(
-                            [html.I(className="fas fa-arrow-left me-2"), "Back to Main"],
+                            [html.I(className=cn.BACK_ICON), "Back to Main"],
                             id="ticker-back-button",
                             color="secondary",
                             size="sm",
@@ -50,43 +50,51 @@ def create_layout(ticker: str = None):
                     # Title
                     html.H1(
                         "🔍 Ticker Searcher",
-                        className="text-center mt-4 mb-2"
+                        className=cn.PAGE_TITLE
                     ),
                     html.P(
                         "Search by ticker to view its sub-industry heatmap and RS indicators",
-                        className="text-center text-muted mb-4"
+                        className=cn.PAGE_SUBTITLE
                     ),
                 ], className="position-relative")
             ])
         ]),
-        
-        # Search Bar Row
-        dbc.Row([
-            dbc.Col([
-                dbc.InputGroup([
-                    dbc.InputGroupText(
-                        html.I(className="fas fa-search"),
-                        className="bg-secondary border-secondary"
-                    ),
-                    dbc.Input(
-                        id="ticker-search-input",
-                        type="text",
-                        placeholder="Enter ticker symbol (e.g., AAPL, MSFT, GOOGL)...",
-                        value=ticker or "",
-                        debounce=True,
-                        className="bg-dark text-light border-secondary",
-                        style={"fontSize": "1.1rem"}
-                    ),
-                    dbc.Button(
-                        "Search",
-                        id="ticker-search-button",
-                        color="success",
-                        className="px-4"
-                    ),
-                ], size="lg")
-            ], md=8, className="mx-auto")
-        ], className="mb-4 p-3 bg-dark rounded"),
-        
+    ]))
+
+
+def _search_bar(ticker: str = None):
+    """Build the search bar row, pre-filled with the initial ticker."""
+    return dbc.Row([
+        dbc.Col([
+            dbc.InputGroup([
+                dbc.InputGroupText(
+                    html.I(className="fas fa-search"),
+                    className="bg-secondary border-secondary"
+                ),
+                dbc.Input(
+                    id="ticker-search-input",
+                    type="text",
+                    placeholder="Enter ticker symbol (e.g., AAPL, MSFT, GOOGL)...",
+                    value=ticker or "",
+                    debounce=True,
+                    className="bg-dark text-light border-secondary",
+                    style={"fontSize": "1.1rem"}
+                ),
+                dbc.Button(
+                    "Search",
+                    id="ticker-search-button",
+                    color="success",
+                    className="px-4"
+                ),
+            ], size="lg")
+        ], md=8, className="mx-auto")
+    ], className=cn.CONTROL_BAR)
+
+
+@lru_cache(maxsize=1)
+def _result_sections() -> tuple:
+    """Build the search result, heatmap and chart sections, pre-serialized."""
+    return tuple(to_plotly_json([
         # Search Result Info
         dbc.Row([
             dbc.Col([
@@ -105,14 +113,10 @@ def create_layout(ticker: str = None):
                 dbc.Row([
                     # Sort Method
                     dbc.Col([
-                        html.Label("Sort By:", className="fw-bold mb-1"),
+                        html.Label("Sort By:", className=cn.CONTROL_LABEL),
                         dbc.RadioItems(
                             id="ticker-sort-method",
-                            options=[
-                                {"label": " Latest RS", "value": "latest"},
-                                {"label": " 4W Change", "value": "change"},
-                                {"label": " A-Z", "value": "alpha"},
-                            ],
+                            options=props.SORT_OPTIONS,
                             value="latest",
                             inline=True,
                             className="mb-3"
@@ -121,24 +125,20 @@ def create_layout(ticker: str = None):
                     
                     # Weeks Slider
                     dbc.Col([
-                        html.Label("Weeks to Display:", className="fw-bold mb-1"),
+                        html.Label("Weeks to Display:", className=cn.CONTROL_LABEL),
                         dcc.Slider(
                             id="ticker-weeks-slider",
                             min=4,
-                            max=26,
+                            max=MAX_STOCK_WEEKS,
                             step=1,
                             value=17,
-                            marks={
-                                4: '4w',
-                                8: '8w',
-                                13: '13w',
-                                17: '17w',
-                                26: '26w'
-                            },
+                            marks=props.STOCK_WEEKS_MARKS,
                             tooltip={"placement": "bottom", "always_visible": False},
+                            # Only fire the heatmap callback when the drag is released
+                            updatemode="mouseup",
                         ),
                     ], md=6),
-                ], className="mb-4 p-3 bg-dark rounded"),
+                ], className=cn.CONTROL_BAR),
             ]
         ),
         
@@ -164,14 +164,7 @@ def create_layout(ticker: str = None):
                                     children=[
                                         dcc.Graph(
                                             id="ticker-rs-heatmap",
-                                            config={
-                                                "displayModeBar": True,
-                                                "scrollZoom": False,
-                                                "displaylogo": False,
-                                                "modeBarButtonsToRemove": [
-                                                    "select2d", "lasso2d", "autoScale2d", "zoomOut2d"
-                                                ],
-                                            },
+                                            config=props.HEATMAP_GRAPH_CONFIG,
                                         )
                                     ]
                                 )
@@ -184,10 +177,10 @@ def create_layout(ticker: str = None):
                 dbc.Row([
                     dbc.Col([
                         html.Div([
-                            html.Span("🔴 Weak (Bottom 33%)", className="mx-3"),
-                            html.Span("🟡 Neutral (Middle 34%)", className="mx-3"),
-                            html.Span("🟢 Strong (Top 33%)", className="mx-3"),
-                        ], className="text-center my-3")
+                            html.Span("🔴 Weak (Bottom 33%)", className=cn.LEGEND_ITEM),
+                            html.Span("🟡 Neutral (Middle 34%)", className=cn.LEGEND_ITEM),
+                            html.Span("🟢 Strong (Top 33%)", className=cn.LEGEND_ITEM),
+                        ], className=cn.LEGEND)
                     ])
                 ]),
             ]
@@ -202,11 +195,11 @@ def create_layout(ticker: str = None):
                     dbc.Col([
                         html.Div(
                             id="ticker-detail-panel",
-                            className="p-3 bg-dark border border-secondary rounded",
+                            className=cn.INFO_PANEL,
                             children=[
                                 html.P(
                                     "Click on a stock in the heatmap to see its price chart with RS indicator",
-                                    className="text-muted text-center mb-0"
+                                    className=cn.INFO_PANEL_PLACEHOLDER
                                 )
                             ]
                         )
@@ -220,12 +213,12 @@ def create_layout(ticker: str = None):
             dbc.Col([
                 html.Div(
                     id="ticker-chart-container",
-                    className="mt-5 pt-3",
+                    className=cn.CHART_SECTION,
                     style={"display": "none"},
                     children=[
                         html.H5(
                             id="ticker-chart-title",
-                            className="text-center mb-3"
+                            className=cn.SECTION_TITLE
                         ),
                         # Daily/Weekly timeframe tabs
                         dbc.Tabs(
@@ -244,14 +237,7 @@ def create_layout(ticker: str = None):
                             children=[
                                 dcc.Graph(
                                     id="ticker-price-rs-chart",
-                                    config={
-                                        "displayModeBar": True,
-                                        "scrollZoom": True,
-                                        "displaylogo": False,
-                                        "modeBarButtonsToRemove": [
-                                            "select2d", "lasso2d"
-                                        ],
-                                    },
+                                    config=props.CHART_GRAPH_CONFIG,
                                     style={
                                         "height": "1000px",
                                         "border": "1px solid #334155",
@@ -270,9 +256,33 @@ def create_layout(ticker: str = None):
             dbc.Col([
                 html.Div(
                     id="ticker-data-stats",
-                    className="text-center text-muted mt-4 mb-3 small"
+                    className=cn.STATS_FOOTER
                 )
             ])
         ]),
+    ]))
+
+
+def create_layout(ticker: str = None):
+    """
+    Create the ticker searcher page layout.
+    
+    Only the ticker store and search bar are built per call; the rest of the
+    page is built once and shared.
+    
+    Args:
+        ticker: Optional initial ticker to search for
+    
+    Returns:
+        Dash layout as the plain JSON dict sent to the browser
+    """
+    return to_plotly_json(dbc.Container([
+        # Store the ticker for callbacks
+        dcc.Store(id="ticker-search-value", data=ticker),
+        *_header_sections(),
+        
+        # Search Bar Row
+        _search_bar(ticker),
         
-    ], fluid=True, className="bg-dark text-light min-vh-100 pb-4")
+        *_result_sections(),
+    ], fluid=True, className=cn.PAGE_CONTAINER))
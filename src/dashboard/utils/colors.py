@@ -3,10 +3,13 @@ Color utilities for the RS heatmap.
 
 Provides color scales and mapping functions for RS percentile visualization.
 """
-from typing import List, Tuple
+import math
+from functools import lru_cache
+from typing import Tuple
 
 
-def get_color_scale() -> List[List]:
+@lru_cache(maxsize=1)
+def get_color_scale() -> Tuple[Tuple[float, str], ...]:
     """
     Get the color scale for RS heatmap.
     
@@ -15,22 +18,24 @@ def get_color_scale() -> List[List]:
     - 33-67: Yellow (neutral)
     - 67-100: Green (strong/outperforming)
     
+    The scale is built once and shared, so it is returned as immutable tuples.
+    
     Returns:
-        List of [position, color] pairs for Plotly colorscale
+        Tuple of (position, color) pairs for Plotly colorscale
     """
-    return [
-        [0.00, "#b91c1c"],   # Dark red (0th percentile)
-        [0.15, "#dc2626"],   # Red
-        [0.25, "#ef4444"],   # Light red
-        [0.33, "#f97316"],   # Orange (weak/neutral boundary)
-        [0.42, "#f59e0b"],   # Amber
-        [0.50, "#eab308"],   # Yellow (50th percentile)
-        [0.58, "#facc15"],   # Light yellow
-        [0.67, "#84cc16"],   # Lime (neutral/strong boundary)
-        [0.75, "#22c55e"],   # Green
-        [0.85, "#16a34a"],   # Dark green
-        [1.00, "#15803d"],   # Darkest green (100th percentile)
-    ]
+    return (
+        (0.00, "#b91c1c"),   # Dark red (0th percentile)
+        (0.15, "#dc2626"),   # Red
+        (0.25, "#ef4444"),   # Light red
+        (0.33, "#f97316"),   # Orange (weak/neutral boundary)
+        (0.42, "#f59e0b"),   # Amber
+        (0.50, "#eab308"),   # Yellow (50th percentile)
+        (0.58, "#facc15"),   # Light yellow
+        (0.67, "#84cc16"),   # Lime (neutral/strong boundary)
+        (0.75, "#22c55e"),   # Green
+        (0.85, "#16a34a"),   # Dark green
+        (1.00, "#15803d"),   # Darkest green (100th percentile)
+    )
 
 
 def percentile_to_rgb(percentile: float) -> Tuple[int, int, int]:
@@ -77,18 +82,29 @@ def percentile_to_rgb(percentile: float) -> Tuple[int, int, int]:
     return (int(r), int(g), int(b))
 
 
+# Hex colors for whole percentiles 0-100, so lookups skip the gradient math
+_HEX_LUT: Tuple[str, ...] = tuple(
+    "#" + bytes(percentile_to_rgb(float(i))).hex() for i in range(101)
+)
+
+
 def percentile_to_hex(percentile: float) -> str:
     """
     Convert RS percentile to hex color string.
     
+    Percentiles are clamped to 0-100 and rounded to the nearest whole
+    number. Missing values (None or NaN, e.g. weeks without data) get the
+    0th percentile color.
+    
     Args:
         percentile: Value from 0 to 100
     
     Returns:
         Hex color string (e.g., "#22c55e")
     """
-    r, g, b = percentile_to_rgb(percentile)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    if percentile is None or math.isnan(percentile):
+        return _HEX_LUT[0]
+    return _HEX_LUT[int(max(0.0, min(100.0, percentile)) + 0.5)]
 
 
 def get_strength_label(percentile: float) -> str:
@@ -11,7 +11,9 @@ the official industry code-based mappings from the data module.
 """
 import logging
 from functools import lru_cache
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional
+from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
@@ -27,266 +29,288 @@ from src.data.stockcharts_industry_mapping import (
 
 
 # Comprehensive industry-level ETF mappings
-# Maps sub-industry names to specific ETFs (legacy support)
-INDUSTRY_ETFS = {
+# (sub-industry name, ETF) pairs, in lookup priority order (legacy support)
+_INDUSTRY_ETF_PAIRS = (
     # ============================================
     # INFORMATION TECHNOLOGY
     # ============================================
-    "Semiconductors": "SMH",
-    "Semiconductor Materials & Equipment": "SMH",  # Exact name from database
-    "Semiconductors & Semiconductor Equipment": "SMH",
-    "Semiconductors and Semiconductor Equipment": "SMH",
-    "Software": "IGV",
-    "Systems Software": "IGV",
-    "Application Software": "IGV",
-    "Technology Hardware, Storage & Peripherals": "QTEC",
-    "Technology Hardware Storage & Peripherals": "QTEC",
-    "Technology Hardware Storage and Peripherals": "QTEC",
-    "Technology Hardware": "QTEC",
-    "IT Services": "SKYY",
-    "IT Consulting & Other Services": "SKYY",
-    "Data Processing & Outsourced Services": "SKYY",
-    "Electronic Equipment & Instruments": "SOXX",
-    "Electronic Equipment, Instruments & Components": "SOXX",
-    "Electronic Components": "SOXX",
-    "Electronic Manufacturing Services": "SOXX",
-    "Communications Equipment": "FCOM",
-    "Internet Services & Infrastructure": "SKYY",
-    "Cloud Computing": "SKYY",
+    ("Semiconductors", "SMH"),
+    ("Semiconductor Materials & Equipment", "SMH"),  # Exact name from database
+    ("Semiconductors & Semiconductor Equipment", "SMH"),
+    ("Semiconductors and Semiconductor Equipment", "SMH"),
+    ("Software", "IGV"),
+    ("Systems Software", "IGV"),
+    ("Application Software", "IGV"),
+    ("Technology Hardware, Storage & Peripherals", "QTEC"),
+    ("Technology Hardware Storage & Peripherals", "QTEC"),
+    ("Technology Hardware Storage and Peripherals", "QTEC"),
+    ("Technology Hardware", "QTEC"),
+    ("IT Services", "SKYY"),
+    ("IT Consulting & Other Services", "SKYY"),
+    ("Data Processing & Outsourced Services", "SKYY"),
+    ("Electronic Equipment & Instruments", "SOXX"),
+    ("Electronic Equipment, Instruments & Components", "SOXX"),
+    ("Electronic Components", "SOXX"),
+    ("Electronic Manufacturing Services", "SOXX"),
+    ("Communications Equipment", "FCOM"),
+    ("Internet Services & Infrastructure", "SKYY"),
+    ("Cloud Computing", "SKYY"),
     
     # ============================================
     # HEALTH CARE
     # ============================================
-    "Biotechnology": "IBB",
-    "Pharmaceuticals": "XPH",
-    "Health Care Equipment": "IHI",
-    "Health Care Supplies": "IHI",
-    "Health Care Equipment & Supplies": "IHI",
-    "Health Care Services": "IHF",
-    "Health Care Facilities": "IHF",
-    "Health Care Providers & Services": "IHF",
-    "Managed Health Care": "IHF",
-    "Health Care Distributors": "IHF",
-    "Life Sciences Tools & Services": "XBI",
-    "Health Care Technology": "EDOC",
-    "Health Care REITs": "IHF",
+    ("Biotechnology", "IBB"),
+    ("Pharmaceuticals", "XPH"),
+    ("Health Care Equipment", "IHI"),
+    ("Health Care Supplies", "IHI"),
+    ("Health Care Equipment & Supplies", "IHI"),
+    ("Health Care Services", "IHF"),
+    ("Health Care Facilities", "IHF"),
+    ("Health Care Providers & Services", "IHF"),
+    ("Managed Health Care", "IHF"),
+    ("Health Care Distributors", "IHF"),
+    ("Life Sciences Tools & Services", "XBI"),
+    ("Health Care Technology", "EDOC"),
+    ("Health Care REITs", "IHF"),
     
     # ============================================
     # FINANCIALS
     # ============================================
-    "Banks": "KBE",
-    "Diversified Banks": "KBE",
-    "Regional Banks": "KRE",
-    "Thrifts & Mortgage Finance": "IAT",
-    "Insurance": "KIE",
-    "Life & Health Insurance": "KIE",
-    "Property & Casualty Insurance": "KIE",
-    "Reinsurance": "KIE",
-    "Multi-line Insurance": "KIE",
-    "Insurance Brokers": "KIE",
-    "Capital Markets": "IYG",
-    "Asset Management & Custody Banks": "IYG",
-    "Investment Banking & Brokerage": "IYG",
-    "Diversified Capital Markets": "IYG",
-    "Financial Exchanges & Data": "IYG",
-    "Consumer Finance": "KBWP",
-    "Diversified Financial Services": "IYG",
-    "Multi-Sector Holdings": "IYG",
-    "Specialized Finance": "IYG",
-    "Mortgage REITs": "REM",
-    "Transaction & Payment Processing Services": "IPAY",
+    ("Banks", "KBE"),
+    ("Diversified Banks", "KBE"),
+    ("Regional Banks", "KRE"),
+    ("Thrifts & Mortgage Finance", "IAT"),
+    ("Insurance", "KIE"),
+    ("Life & Health Insurance", "KIE"),
+    ("Property & Casualty Insurance", "KIE"),
+    ("Reinsurance", "KIE"),
+    ("Multi-line Insurance", "KIE"),
+    ("Insurance Brokers", "KIE"),
+    ("Capital Markets", "IYG"),
+    ("Asset Management & Custody Banks", "IYG"),
+    ("Investment Banking & Brokerage", "IYG"),
+    ("Diversified Capital Markets", "IYG"),
+    ("Financial Exchanges & Data", "IYG"),
+    ("Consumer Finance", "KBWP"),
+    ("Diversified Financial Services", "IYG"),
+    ("Multi-Sector Holdings", "IYG"),
+    ("Specialized Finance", "IYG"),
+    ("Mortgage REITs", "REM"),
+    ("Transaction & Payment Processing Services", "IPAY"),
     
     # ============================================
     # CONSUMER DISCRETIONARY
     # ============================================
-    "Automobiles": "CARZ",
-    "Auto Components": "CARZ",
-    "Automobile Manufacturers": "CARZ",
-    "Automotive Parts & Equipment": "CARZ",
-    "Tires & Rubber": "CARZ",
-    "Homebuilding": "XHB",
-    "Home Improvement Retail": "XHB",
-    "Household Durables": "XHB",
-    "Building Products": "XHB",
-    "Home Furnishings": "XHB",
-    "Home Furnishing Retail": "XHB",
-    "Homefurnishing Retail": "XHB",    # Alternate spelling
-    "Housewares & Specialties": "XHB",
-    "Hotels, Resorts & Cruise Lines": "PEJ",
-    "Hotels & Motels": "PEJ",
-    "Cruise Lines": "PEJ",
-    "Casinos & Gaming": "BJK",
-    "Restaurants": "PBJ",
-    "Leisure Facilities": "PEJ",
-    "Leisure Products": "PEJ",
-    "Movies & Entertainment": "PEJ",
-    "Specialty Retail": "XRT",
-    "Specialty Stores": "XRT",      # Specific retail stores
-    "Apparel Retail": "XRT",
-    "Apparel, Accessories & Luxury Goods": "XRT",
-    "Footwear": "XRT",
-    "Textiles": "XRT",
-    "Textiles, Apparel & Luxury Goods": "XRT",
-    "Computer & Electronics Retail": "XRT",
-    "Department Stores": "XRT",
-    "General Merchandise Stores": "XRT",
-    "Distributors": "XRT",
-    "Internet & Direct Marketing Retail": "IBUY",
-    "Broadline Retail": "IBUY",
-    "E-Commerce": "IBUY",
-    "Consumer Services": "PEJ",
-    "Education Services": "PEJ",
-    "Specialized Consumer Services": "PEJ",
+    ("Automobiles", "CARZ"),
+    ("Auto Components", "CARZ"),
+    ("Automobile Manufacturers", "CARZ"),
+    ("Automotive Parts & Equipment", "CARZ"),
+    ("Tires & Rubber", "CARZ"),
+    ("Homebuilding", "XHB"),
+    ("Home Improvement Retail", "XHB"),
+    ("Household Durables", "XHB"),
+    ("Building Products", "XHB"),
+    ("Home Furnishings", "XHB"),
+    ("Home Furnishing Retail", "XHB"),
+    ("Homefurnishing Retail", "XHB"),    # Alternate spelling
+    ("Housewares & Specialties", "XHB"),
+    ("Hotels, Resorts & Cruise Lines", "PEJ"),
+    ("Hotels & Motels", "PEJ"),
+    ("Cruise Lines", "PEJ"),
+    ("Casinos & Gaming", "BJK"),
+    ("Restaurants", "PBJ"),
+    ("Leisure Facilities", "PEJ"),
+    ("Leisure Products", "PEJ"),
+    ("Movies & Entertainment", "PEJ"),
+    ("Specialty Retail", "XRT"),
+    ("Specialty Stores", "XRT"),      # Specific retail stores
+    ("Apparel Retail", "XRT"),
+    ("Apparel, Accessories & Luxury Goods", "XRT"),
+    ("Footwear", "XRT"),
+    ("Textiles", "XRT"),
+    ("Textiles, Apparel & Luxury Goods", "XRT"),
+    ("Computer & Electronics Retail", "XRT"),
+    ("Department Stores", "XRT"),
+    ("General Merchandise Stores", "XRT"),
+    ("Distributors", "XRT"),
+    ("Internet & Direct Marketing Retail", "IBUY"),
+    ("Broadline Retail", "IBUY"),
+    ("E-Commerce", "IBUY"),
+    ("Consumer Services", "PEJ"),
+    ("Education Services", "PEJ"),
+    ("Specialized Consumer Services", "PEJ"),
     
     # ============================================
     # COMMUNICATION SERVICES
     # ============================================
-    "Interactive Media & Services": "SOCL",
-    "Interactive Home Entertainment": "ESPO",
-    "Movies & Entertainment": "PEJ",
-    "Entertainment": "PEJ",
-    "Broadcasting": "FCOM",
-    "Cable & Satellite": "FCOM",
-    "Media": "FCOM",
-    "Advertising": "FCOM",
-    "Publishing": "FCOM",
-    "Wireless Telecommunication Services": "IYZ",
-    "Integrated Telecommunication Services": "IYZ",
-    "Diversified Telecommunication Services": "IYZ",
-    "Alternative Carriers": "IYZ",
+    ("Interactive Media & Services", "SOCL"),
+    ("Interactive Home Entertainment", "ESPO"),
+    ("Entertainment", "PEJ"),
+    ("Broadcasting", "FCOM"),
+    ("Cable & Satellite", "FCOM"),
+    ("Media", "FCOM"),
+    ("Advertising", "FCOM"),
+    ("Publishing", "FCOM"),
+    ("Wireless Telecommunication Services", "IYZ"),
+    ("Integrated Telecommunication Services", "IYZ"),
+    ("Diversified Telecommunication Services", "IYZ"),
+    ("Alternative Carriers", "IYZ"),
     
     # ============================================
     # INDUSTRIALS
     # ============================================
-    "Aerospace & Defense": "ITA",
-    "Airlines": "JETS",
-    "Air Freight & Logistics": "IYT",
-    "Railroads": "IYT",
-    "Trucking": "IYT",
-    "Marine Transportation": "SEA",
-    "Marine": "SEA",
-    "Transportation Infrastructure": "IYT",
-    "Airport Services": "IYT",
-    "Highways & Railtracks": "IYT",
-    "Passenger Airlines": "JETS",
-    "Industrial Machinery & Supplies & Components": "FIW",
-    "Machinery": "FIW",
-    "Industrial Machinery": "FIW",
-    "Agricultural & Farm Machinery": "MOO",
-    "Construction Machinery & Heavy Transportation Equipment": "FIW",
-    "Construction & Engineering": "PKB",
-    "Construction & Farm Machinery & Heavy Trucks": "FIW",
-    "Electrical Equipment": "GRID",
-    "Electrical Components & Equipment": "GRID",
-    "Heavy Electrical Equipment": "GRID",
-    "Building Products": "XHB",
-    "Industrial Conglomerates": "FIW",
-    "Trading Companies & Distributors": "FIW",
-    "Commercial Services & Supplies": "FIW",
-    "Environmental & Facilities Services": "EVX",
-    "Office Services & Supplies": "FIW",
-    "Diversified Support Services": "FIW",
-    "Security & Alarm Services": "HACK",
-    "Human Resource & Employment Services": "FIW",
-    "Research & Consulting Services": "FIW",
-    "Professional Services": "FIW",
+    ("Aerospace & Defense", "ITA"),
+    ("Airlines", "JETS"),
+    ("Air Freight & Logistics", "IYT"),
+    ("Railroads", "IYT"),
+    ("Trucking", "IYT"),
+    ("Marine Transportation", "SEA"),
+    ("Marine", "SEA"),
+    ("Transportation Infrastructure", "IYT"),
+    ("Airport Services", "IYT"),
+    ("Highways & Railtracks", "IYT"),
+    ("Passenger Airlines", "JETS"),
+    ("Industrial Machinery & Supplies & Components", "FIW"),
+    ("Machinery", "FIW"),
+    ("Industrial Machinery", "FIW"),
+    ("Agricultural & Farm Machinery", "MOO"),
+    ("Construction Machinery & Heavy Transportation Equipment", "FIW"),
+    ("Construction & Engineering", "PKB"),
+    ("Construction & Farm Machinery & Heavy Trucks", "FIW"),
+    ("Electrical Equipment", "GRID"),
+    ("Electrical Components & Equipment", "GRID"),
+    ("Heavy Electrical Equipment", "GRID"),
+    ("Industrial Conglomerates", "FIW"),
+    ("Trading Companies & Distributors", "FIW"),
+    ("Commercial Services & Supplies", "FIW"),
+    ("Environmental & Facilities Services", "EVX"),
+    ("Office Services & Supplies", "FIW"),
+    ("Diversified Support Services", "FIW"),
+    ("Security & Alarm Services", "HACK"),
+    ("Human Resource & Employment Services", "FIW"),
+    ("Research & Consulting Services", "FIW"),
+    ("Professional Services", "FIW"),
     
     # ============================================
     # CONSUMER STAPLES
     # ============================================
-    "Food Retail": "PBJ",
-    "Food & Staples Retailing": "PBJ",
-    "Hypermarkets & Super Centers": "PBJ",
-    "Drug Retail": "PBJ",
-    "Beverages": "PBJ",
-    "Brewers": "PBJ",
-    "Distillers & Vintners": "PBJ",
-    "Soft Drinks & Non-alcoholic Beverages": "PBJ",
-    "Food Products": "PBJ",
-    "Agricultural Products & Services": "MOO",
-    "Packaged Foods & Meats": "PBJ",
-    "Household Products": "PBJ",
-    "Personal Care Products": "PBJ",
-    "Personal Products": "PBJ",
-    "Tobacco": "PBJ",
+    ("Food Retail", "PBJ"),
+    ("Food & Staples Retailing", "PBJ"),
+    ("Hypermarkets & Super Centers", "PBJ"),
+    ("Drug Retail", "PBJ"),
+    ("Beverages", "PBJ"),
+    ("Brewers", "PBJ"),
+    ("Distillers & Vintners", "PBJ"),
+    ("Soft Drinks & Non-alcoholic Beverages", "PBJ"),
+    ("Food Products", "PBJ"),
+    ("Agricultural Products & Services", "MOO"),
+    ("Packaged Foods & Meats", "PBJ"),
+    ("Household Products", "PBJ"),
+    ("Personal Care Products", "PBJ"),
+    ("Personal Products", "PBJ"),
+    ("Tobacco", "PBJ"),
     
     # ============================================
     # ENERGY
     # ============================================
-    "Oil & Gas Exploration & Production": "XOP",
-    "Oil & Gas Equipment & Services": "OIH",
-    "Oil & Gas Drilling": "OIH",
-    "Oil & Gas Refining & Marketing": "CRAK",
-    "Oil & Gas Storage & Transportation": "AMLP",
-    "Integrated Oil & Gas": "XOP",
-    "Coal & Consumable Fuels": "KOL",
-    "Renewable Energy": "ICLN",
-    "Solar": "TAN",
-    "Wind": "FAN",
+    ("Oil & Gas Exploration & Production", "XOP"),
+    ("Oil & Gas Equipment & Services", "OIH"),
+    ("Oil & Gas Drilling", "OIH"),
+    ("Oil & Gas Refining & Marketing", "CRAK"),
+    ("Oil & Gas Storage & Transportation", "AMLP"),
+    ("Integrated Oil & Gas", "XOP"),
+    ("Coal & Consumable Fuels", "KOL"),
+    ("Renewable Energy", "ICLN"),
+    ("Solar", "TAN"),
+    ("Wind", "FAN"),
     
     # ============================================
     # MATERIALS
     # ============================================
-    "Chemicals": "VAW",            # Vanguard Materials ETF
-    "Commodity Chemicals": "VAW",  # Vanguard Materials ETF
-    "Diversified Chemicals": "VAW",
-    "Specialty Chemicals": "PYZ",  # Invesco Dynamic Basic Materials ETF
-    "Fertilizers & Agricultural Chemicals": "MOO",
-    "Industrial Gases": "FMAT",    # Fidelity MSCI Materials Index ETF
-    "Metals & Mining": "XME",
-    "Diversified Metals & Mining": "XME",
-    "Copper": "COPX",
-    "Gold": "GDX",
-    "Precious Metals & Minerals": "GDX",
-    "Silver": "SIL",
-    "Steel": "SLX",
-    "Aluminum": "XME",
-    "Construction Materials": "PKB",
-    "Containers & Packaging": "VAW",
-    "Metal, Glass & Plastic Containers": "VAW",
-    "Paper & Plastic Packaging Products & Materials": "VAW",
-    "Paper & Forest Products": "WOOD",
-    "Forest Products": "WOOD",
-    "Paper Products": "WOOD",
-    "Lumber": "WOOD",
+    ("Chemicals", "VAW"),            # Vanguard Materials ETF
+    ("Commodity Chemicals", "VAW"),  # Vanguard Materials ETF
+    ("Diversified Chemicals", "VAW"),
+    ("Specialty Chemicals", "PYZ"),  # Invesco Dynamic Basic Materials ETF
+    ("Fertilizers & Agricultural Chemicals", "MOO"),
+    ("Industrial Gases", "FMAT"),    # Fidelity MSCI Materials Index ETF
+    ("Metals & Mining", "XME"),
+    ("Diversified Metals & Mining", "XME"),
+    ("Copper", "COPX"),
+    ("Gold", "GDX"),
+    ("Precious Metals & Minerals", "GDX"),
+    ("Silver", "SIL"),
+    ("Steel", "SLX"),
+    ("Aluminum", "XME"),
+    ("Construction Materials", "PKB"),
+    ("Containers & Packaging", "VAW"),
+    ("Metal, Glass & Plastic Containers", "VAW"),
+    ("Paper & Plastic Packaging Products & Materials", "VAW"),
+    ("Paper & Forest Products", "WOOD"),
+    ("Forest Products", "WOOD"),
+    ("Paper Products", "WOOD"),
+    ("Lumber", "WOOD"),
     
     # ============================================
     # UTILITIES
     # ============================================
-    "Electric Utilities": "VPU",   # Vanguard Utilities ETF
-    "Multi-Utilities": "VPU",
-    "Gas Utilities": "FCG",        # First Trust Natural Gas ETF
-    "Water Utilities": "PHO",
-    "Independent Power Producers & Energy Traders": "VPU",
-    "Independent Power and Renewable Electricity Producers": "QCLN",
-    "Renewable Electricity": "QCLN",
+    ("Electric Utilities", "VPU"),   # Vanguard Utilities ETF
+    ("Multi-Utilities", "VPU"),
+    ("Gas Utilities", "FCG"),        # First Trust Natural Gas ETF
+    ("Water Utilities", "PHO"),
+    ("Independent Power Producers & Energy Traders", "VPU"),
+    ("Independent Power and Renewable Electricity Producers", "QCLN"),
+    ("Renewable Electricity", "QCLN"),
     
     # ============================================
     # REAL ESTATE
     # ============================================
-    "REITs": "VNQ",
-    "Diversified REITs": "VNQ",
-    "Residential REITs": "REZ",
-    "Retail REITs": "RTL",
-    "Office REITs": "VNQ",
-    "Industrial REITs": "INDS",
-    "Specialized REITs": "VNQ",
-    "Hotel & Resort REITs": "PEJ",
-    "Health Care REITs": "IHF",
-    "Data Center REITs": "SRVR",
-    "Telecom Tower REITs": "SRVR",   # Infrastructure REITs - telecom towers
-    "Infrastructure REITs": "SRVR",
-    "Timber REITs": "WOOD",
-    "Real Estate Management & Development": "VNQ",
-    "Real Estate Operating Companies": "VNQ",
-    "Real Estate Services": "VNQ",
-}
+    ("REITs", "VNQ"),
+    ("Diversified REITs", "VNQ"),
+    ("Residential REITs", "REZ"),
+    ("Retail REITs", "RTL"),
+    ("Office REITs", "VNQ"),
+    ("Industrial REITs", "INDS"),
+    ("Specialized REITs", "VNQ"),
+    ("Hotel & Resort REITs", "PEJ"),
+    ("Data Center REITs", "SRVR"),
+    ("Telecom Tower REITs", "SRVR"),   # Infrastructure REITs - telecom towers
+    ("Infrastructure REITs", "SRVR"),
+    ("Timber REITs", "WOOD"),
+    ("Real Estate Management & Development", "VNQ"),
+    ("Real Estate Operating Companies", "VNQ"),
+    ("Real Estate Services", "VNQ"),
+)
+
+
+def _build_industry_etfs(pairs) -> dict:
+    """
+    Build the sub-industry name to ETF mapping.
+    
+    Unlike a dict literal, which silently keeps the last duplicate key,
+    a repeated name fails loudly at import.
+    
+    Args:
+        pairs: (sub-industry name, ETF ticker) pairs
+    
+    Returns:
+        Dict mapping sub-industry names to ETF tickers, in pair order
+    """
+    industry_etfs = {}
+    for name, etf in pairs:
+        if name in industry_etfs:
+            raise ValueError(f"Duplicate sub-industry name in INDUSTRY_ETFS: '{name}'")
+        industry_etfs[name] = etf
+    return industry_etfs
+
+
+# Maps sub-industry names to specific ETFs (read-only)
+INDUSTRY_ETFS = MappingProxyType(_build_industry_etfs(_INDUSTRY_ETF_PAIRS))
 
 # Default fallback ETF (S&P 500) - only used when no industry match found
 DEFAULT_ETF = "SPY"
 
-# Sector name to ETF mapping (using XL* sector ETFs)
-SECTOR_NAME_TO_ETF = {
+# Sector name to ETF mapping (using XL* sector ETFs, read-only)
+SECTOR_NAME_TO_ETF = MappingProxyType({
     "Energy": "XLE",
     "Materials": "XLB",
     "Industrials": "XLI",
@@ -298,9 +322,10 @@ SECTOR_NAME_TO_ETF = {
     "Communication Services": "XLC",
     "Utilities": "XLU",
     "Real Estate": "XLRE",
-}
+})
 
 
+@lru_cache(maxsize=2048)
 def normalize_name(name: str) -> str:
     """
     Normalize sub-industry name for matching.
@@ -322,9 +347,43 @@ def normalize_name(name: str) -> str:
     )
 
 
+def _first_wins(pairs) -> Mapping[str, str]:
+    """Build a read-only lookup keeping the first value seen for each key."""
+    lookup = {}
+    for key, value in pairs:
+        lookup.setdefault(key, value)
+    return MappingProxyType(lookup)
+
+
+# Lookup tables for get_etf_for_subindustry, normalized once at import.
+# The first entry wins on collisions, matching the original scan order.
+_GICS_NORMALIZED_NAMES = tuple(
+    (normalize_name(entry.name), entry.name, entry.primary_etf)
+    for entry in GICS_SUBINDUSTRY_ETF_MAP.values()
+)
+_GICS_ETF_BY_NORMALIZED_NAME = _first_wins(
+    (normalized, etf) for normalized, _, etf in _GICS_NORMALIZED_NAMES
+)
+_NORMALIZED_INDUSTRY_ETF_ITEMS = tuple(
+    (normalize_name(industry_key), industry_key, etf) for industry_key, etf in INDUSTRY_ETFS.items()
+)
+# Public read-only view of INDUSTRY_ETFS keyed by normalize_name(name)
+NORMALIZED_INDUSTRY_ETFS = _first_wins(
+    (normalized, etf) for normalized, _, etf in _NORMALIZED_INDUSTRY_ETF_ITEMS
+)
+_SECTOR_ETF_BY_LOWER_SECTOR_NAME = _first_wins(
+    (entry.sector_name.lower(), SECTOR_ETFS.get(entry.sector_code, DEFAULT_ETF))
+    for entry in GICS_SUBINDUSTRY_ETF_MAP.values()
+)
+_SECTOR_NAME_TO_ETF_BY_LOWER_NAME = _first_wins(
+    (name.lower(), ticker) for name, ticker in SECTOR_NAME_TO_ETF.items()
+)
+
+
+@lru_cache(maxsize=256)
 def get_etf_for_sector(sector_name: str) -> str:
     """
-    Get the representative XL* ETF for a GICS sector.
+    Get the representative XL* ETF for a GICS sector (cached).
     
     Args:
         sector_name: Name of the GICS sector (e.g., "Energy", "Information Technology")
@@ -341,84 +400,121 @@ def get_etf_for_sector(sector_name: str) -> str:
         return etf
     
     # Try case-insensitive lookup
-    normalized = sector_name.strip().lower()
-    for name, ticker in SECTOR_NAME_TO_ETF.items():
-        if name.lower() == normalized:
-            return ticker
+    etf = _SECTOR_NAME_TO_ETF_BY_LOWER_NAME.get(sector_name.strip().lower())
+    if etf:
+        return etf
     
     logger.warning(f"No sector ETF mapping found for '{sector_name}', using {DEFAULT_ETF}")
     return DEFAULT_ETF
 
 
-def get_etf_for_subindustry(subindustry_name: str, sector_name: str = "") -> str:
+@lru_cache(maxsize=4096)
+def _lookup_industry_etf(subindustry_name: str, sector_name: str = "") -> Optional[str]:
     """
-    Get the representative ETF for a sub-industry.
+    Match a sub-industry name to its ETF (cached).
     
-    PRIORITY ORDER:
-    1. Official GICS_SUBINDUSTRY_ETF_MAP (by exact name match)
-    2. Official GICS_SUBINDUSTRY_ETF_MAP (by normalized name match)
-    3. Sector ETF fallback based on sector_name
-    4. SPY as final fallback
+    Results are cached per (subindustry_name, sector_name), so the
+    no-match warning is only logged the first time a name is seen.
     
     Args:
         subindustry_name: Name of the GICS sub-industry
         sector_name: Name of the GICS sector (used for sector fallback)
     
     Returns:
-        ETF ticker symbol
+        ETF ticker symbol, or None if nothing matched
     """
     if not subindustry_name:
-        return DEFAULT_ETF
+        return None
     
     # Normalize the input name
     normalized_input = normalize_name(subindustry_name)
     
-    # PRIORITY 1: Try exact match in official GICS mapping
-    for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
-        if entry.name.lower() == subindustry_name.lower():
-            logger.debug(f"Exact match for '{subindustry_name}': {entry.primary_etf}")
-            return entry.primary_etf
-    
-    # PRIORITY 2: Try normalized match in official GICS mapping
-    for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
-        if normalize_name(entry.name) == normalized_input:
-            logger.debug(f"Normalized match for '{subindustry_name}': {entry.primary_etf}")
-            return entry.primary_etf
+    # PRIORITY 1-2: Exact or normalized match in official GICS mapping.
+    # normalize_name() starts from name.lower(), so every case-insensitive
+    # exact match is also a normalized match with the same first-wins ETF.
+    etf = _GICS_ETF_BY_NORMALIZED_NAME.get(normalized_input)
+    if etf:
+        logger.debug(f"Normalized match for '{subindustry_name}': {etf}")
+        return etf
     
     # PRIORITY 3: Try partial match in official GICS mapping (for minor variations)
-    for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
-        normalized_entry = normalize_name(entry.name)
+    for normalized_entry, entry_name, etf in _GICS_NORMALIZED_NAMES:
         # Check if names are substantially similar
         if normalized_input in normalized_entry or normalized_entry in normalized_input:
-            logger.debug(f"Partial match for '{subindustry_name}' -> '{entry.name}': {entry.primary_etf}")
-            return entry.primary_etf
+            logger.debug(f"Partial match for '{subindustry_name}' -> '{entry_name}': {etf}")
+            return etf
     
     # PRIORITY 4: Try legacy INDUSTRY_ETFS mapping (for custom/generated codes)
-    for industry_key, etf in INDUSTRY_ETFS.items():
-        if normalize_name(industry_key) == normalized_input:
-            logger.debug(f"Legacy INDUSTRY_ETFS match for '{subindustry_name}': {etf}")
-            return etf
+    etf = NORMALIZED_INDUSTRY_ETFS.get(normalized_input)
+    if etf:
+        logger.debug(f"Legacy INDUSTRY_ETFS match for '{subindustry_name}': {etf}")
+        return etf
     
     # PRIORITY 5: Try partial match in legacy INDUSTRY_ETFS
-    for industry_key, etf in INDUSTRY_ETFS.items():
-        normalized_key = normalize_name(industry_key)
+    for normalized_key, industry_key, etf in _NORMALIZED_INDUSTRY_ETF_ITEMS:
         if normalized_key in normalized_input or normalized_input in normalized_key:
             logger.debug(f"Legacy INDUSTRY_ETFS partial match for '{subindustry_name}' -> '{industry_key}': {etf}")
             return etf
     
     # PRIORITY 6: Sector fallback
     if sector_name:
-        normalized_sector = sector_name.lower().strip()
-        for sector_code, etf in SECTOR_ETFS.items():
-            # Check if any entry in the mapping has this sector
-            for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
-                if entry.sector_name.lower() == normalized_sector:
-                    logger.debug(f"Sector fallback for '{subindustry_name}' ({sector_name}): {SECTOR_ETFS.get(entry.sector_code, DEFAULT_ETF)}")
-                    return SECTOR_ETFS.get(entry.sector_code, DEFAULT_ETF)
-    
-    # PRIORITY 5: Final fallback to SPY
+        etf = _SECTOR_ETF_BY_LOWER_SECTOR_NAME.get(sector_name.lower().strip())
+        if etf:
+            logger.debug(f"Sector fallback for '{subindustry_name}' ({sector_name}): {etf}")
+            return etf
+    
+    # No match - callers fall back to SPY
     logger.warning(f"No ETF mapping found for sub-industry '{subindustry_name}', using {DEFAULT_ETF}")
-    return DEFAULT_ETF
+    return None
+
+
+def get_etf_for_subindustry(subindustry_name: str, sector_name: str = "") -> str:
+    """
+    Get the representative ETF for a sub-industry.
+    
+    PRIORITY ORDER:
+    1. Official GICS_SUBINDUSTRY_ETF_MAP (by exact name match)
+    2. Official GICS_SUBINDUSTRY_ETF_MAP (by normalized name match)
+    3. Sector ETF fallback based on sector_name
+    4. SPY as final fallback
+    
+    Args:
+        subindustry_name: Name of the GICS sub-industry
+        sector_name: Name of the GICS sector (used for sector fallback)
+    
+    Returns:
+        ETF ticker symbol
+    """
+    return _lookup_industry_etf(subindustry_name, sector_name) or DEFAULT_ETF
+
+
+def get_etfs_for_subindustries(
+    subindustry_names: Iterable[str],
+    sector_names: Optional[Iterable[str]] = None
+) -> List[str]:
+    """
+    Get representative ETFs for many sub-industries at once.
+    
+    Each distinct (name, sector) pair is matched once with the same rules as
+    get_etf_for_subindustry, then mapped back onto the input order. Accepts
+    DataFrame columns directly; missing values (None/NaN) are treated as
+    empty names.
+    
+    Args:
+        subindustry_names: Names of the GICS sub-industries
+        sector_names: Optional sector names, parallel to subindustry_names
+    
+    Returns:
+        List of ETF ticker symbols, one per input name
+    """
+    names = [name if isinstance(name, str) else "" for name in subindustry_names]
+    if sector_names is None:
+        sectors = [""] * len(names)
+    else:
+        sectors = [sector if isinstance(sector, str) else "" for sector in sector_names]
+    pairs = list(zip(names, sectors))
+    resolved = {pair: get_etf_for_subindustry(*pair) for pair in dict.fromkeys(pairs)}
+    return [resolved[pair] for pair in pairs]
 
 
 def get_etf_by_gics_code(gics_code: str) -> str:
@@ -437,6 +533,7 @@ def get_etf_by_gics_code(gics_code: str) -> str:
     return get_etf_for_gics_code(gics_code)
 
 
+@lru_cache(maxsize=4096)
 def get_etf_with_fallback(
     gics_code: Optional[str] = None,
     subindustry_name: Optional[str] = None,
@@ -460,50 +557,55 @@ def get_etf_with_fallback(
         ETF ticker symbol
     """
     # Try GICS code first (most accurate)
-    if gics_code and gics_code in GICS_SUBINDUSTRY_ETF_MAP:
-        return GICS_SUBINDUSTRY_ETF_MAP[gics_code].primary_etf
+    entry = GICS_SUBINDUSTRY_ETF_MAP.get(gics_code) if gics_code else None
+    if entry is not None:
+        return entry.primary_etf
     
     # Try name-based lookup
     if subindustry_name:
-        etf = get_etf_for_subindustry(subindustry_name, sector_name or "")
-        if etf != DEFAULT_ETF:
+        etf = _lookup_industry_etf(subindustry_name, sector_name or "")
+        if etf is not None:
             return etf
     
     # Try sector fallback via GICS code
     if gics_code and len(gics_code) >= 2:
-        sector_code = gics_code[:2]
-        if sector_code in SECTOR_ETFS:
-            return SECTOR_ETFS[sector_code]
+        sector_etf = SECTOR_ETFS.get(gics_code[:2])
+        if sector_etf is not None:
+            return sector_etf
     
     return DEFAULT_ETF
 
 
-def get_subindustry_etf_info(gics_code: str) -> Optional[dict]:
+@lru_cache(maxsize=2048)
+def get_subindustry_etf_info(gics_code: str) -> Optional[Mapping]:
     """
-    Get complete ETF information for a GICS sub-industry.
+    Get complete ETF information for a GICS sub-industry (cached).
+    
+    The returned mapping is shared between callers, so it is read-only.
     
     Args:
         gics_code: 8-digit GICS sub-industry code
     
     Returns:
-        Dict with ETF info or None if not found
+        Read-only mapping with ETF info or None if not found
     """
     info = get_subindustry_info(gics_code)
     if info:
-        return {
+        return MappingProxyType({
             "code": info.code,
             "name": info.name,
             "primary_etf": info.primary_etf,
             "alt_etf": info.alt_etf,
             "index_name": info.index_name,
             "sector_name": info.sector_name,
-            "industry_name": info.industry_name,
-        }
+            # Codes are industry-level, so the industry is the entry itself
+            "industry_name": info.name,
+        })
     return None
 
 
 # Common ETFs that are listed on AMEX/NYSE Arca
-AMEX_ETFS = {
+AMEX_ETFS = frozenset({
     # Sector SPDRs
     "XLE", "XLF", "XLK", "XLV", "XLI", "XLY", "XLP", "XLB", "XLU", "XLRE", "XLC",
     # Industry SPDRs
@@ -523,10 +625,10 @@ AMEX_ETFS = {
     # Other popular ETFs (NYSE Arca listed)
     "SPY", "DIA", "IWM", "EFA", "EEM", "GLD", "SLV", "USO", "UNG",
     "JETS", "ARKK", "ARKG", "ARKW", "ARKF", "AMLP", "MLPA",
-}
+})
 
 # Known NASDAQ-listed stocks/ETFs (major tech companies and NASDAQ ETFs)
-NASDAQ_SYMBOLS = {
+NASDAQ_SYMBOLS = frozenset({
     # Major NASDAQ stocks
     "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "META", "NVDA", "TSLA", "NFLX", "ADBE",
     "INTC", "CSCO", "CMCSA", "PEP", "AVGO", "COST", "TXN", "QCOM", "TMUS", "AMGN",
@@ -536,7 +638,17 @@ NASDAQ_SYMBOLS = {
     "ABNB", "DASH", "COIN", "HOOD", "RBLX", "U", "PLTR", "SNOW", "NET", "MDB",
     # NASDAQ-listed ETFs
     "QQQ", "TQQQ", "SQQQ", "PSQ", "ONEQ", "QQQM", "QQQJ",
-}
+})
+
+# Known symbol -> exchange in one table; AMEX is applied last so it wins
+# for any symbol present in both sets, as in the original membership order
+_SYMBOL_EXCHANGE = MappingProxyType({
+    **dict.fromkeys(NASDAQ_SYMBOLS, "NASDAQ"),
+    **dict.fromkeys(AMEX_ETFS, "AMEX"),
+})
+
+# Leading letters of common ETF families (SPDR X*, iShares I*, Vanguard V*, ...)
+_ETF_PREFIXES = frozenset("XIVSK")
 
 
 @lru_cache(maxsize=2000)
@@ -591,19 +703,15 @@ def get_exchange_for_symbol(symbol: str, use_yfinance_fallback: bool = False) ->
     """
     symbol_upper = symbol.upper()
     
-    # ETFs are typically on AMEX (NYSE Arca)
-    if symbol_upper in AMEX_ETFS:
-        return "AMEX"
-    
-    # Check if it's a known NASDAQ stock
-    if symbol_upper in NASDAQ_SYMBOLS:
-        return "NASDAQ"
+    # Known AMEX (NYSE Arca) ETFs and NASDAQ stocks/ETFs
+    exchange = _SYMBOL_EXCHANGE.get(symbol_upper)
+    if exchange:
+        return exchange
     
     # ETFs with common suffixes (3-4 letter symbols starting with common ETF prefixes)
-    if len(symbol_upper) <= 4 and symbol_upper.startswith(("X", "I", "V", "S", "K")):
+    if len(symbol_upper) <= 4 and symbol_upper[:1] in _ETF_PREFIXES:
         # Likely an ETF - use AMEX
-        if symbol_upper not in NASDAQ_SYMBOLS:
-            return "AMEX"
+        return "AMEX"
     
     # Try yfinance lookup for unknown symbols (optional, can be slow)
     if use_yfinance_fallback:
@@ -615,6 +723,22 @@ def get_exchange_for_symbol(symbol: str, use_yfinance_fallback: bool = False) ->
     return "NYSE"
 
 
+# TradingView widget embed URL. The fixed parameters are encoded once; only
+# the symbol and interval vary per call.
+_TRADINGVIEW_WIDGET_BASE = "https://s.tradingview.com/widgetembed/?"
+_TRADINGVIEW_WIDGET_PARAMS = urlencode({
+    "theme": "dark",
+    "style": "1",
+    "locale": "en",
+    "enable_publishing": "false",
+    "hide_top_toolbar": "false",
+    "hide_legend": "false",
+    "save_image": "false",
+    "hide_volume": "false",
+    "support_host": "https://www.tradingview.com",
+})
+
+
 def get_tradingview_symbol(symbol: str, exchange: str = None) -> str:
     """
     Get the TradingView symbol.
@@ -632,6 +756,7 @@ def get_tradingview_symbol(symbol: str, exchange: str = None) -> str:
     return symbol.upper()
 
 
+@lru_cache(maxsize=1024)
 def get_tradingview_widget_url(symbol: str, interval: str = "W", exchange: str = None) -> str:
     """
     Generate a TradingView widget embed URL.
@@ -648,19 +773,5 @@ def get_tradingview_widget_url(symbol: str, interval: str = "W", exchange: str =
         TradingView widget embed URL
     """
     # Use just the ticker - TradingView will show first match
-    ticker = symbol.upper()
-    
-    return (
-        f"https://s.tradingview.com/widgetembed/?"
-        f"symbol={ticker}&"
-        f"interval={interval}&"
-        f"theme=dark&"
-        f"style=1&"
-        f"locale=en&"
-        f"enable_publishing=false&"
-        f"hide_top_toolbar=false&"
-        f"hide_legend=false&"
-        f"save_image=false&"
-        f"hide_volume=false&"
-        f"support_host=https%3A%2F%2Fwww.tradingview.com"
-    )
+    query = urlencode({"symbol": symbol.upper(), "interval": interval})
+    return f"{_TRADINGVIEW_WIDGET_BASE}{query}&{_TRADINGVIEW_WIDGET_PARAMS}"
@@ -14,6 +14,22 @@ CHART_COLUMN = "📈"
 # Maximum label length before truncation
 MAX_LABEL_LENGTH = 45
 
+# Default cap on stock heatmap rows - larger sub-industries are trimmed to the
+# top N stocks by mean percentile to keep the browser render responsive
+MAX_STOCK_ROWS = 200
+
+# Weeks fetched for the stock heatmap - the weeks slider narrows this range
+# client-side, so the stock heatmap weeks sliders use it as their maximum
+MAX_STOCK_WEEKS = 26
+
+# Weeks slider maximum on the main (sub-industry and sector) heatmap page,
+# which is rendered server-side for the selected number of weeks
+MAX_INDUSTRY_WEEKS = 26
+
+# Maximum bars per price chart trace - longer series are merged into
+# OHLC buckets before plotting to bound the figure payload
+MAX_PRICE_POINTS = 1000
+
 # Layout margins
 MARGINS = {
     "left": 300,      # Space for y-axis labels (sub-industry names)
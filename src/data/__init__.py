@@ -45,8 +45,10 @@ from src.data.stockcharts_industry_mapping import (
 from src.data.additional_tickers import (
     INDUSTRY_TICKERS,
     get_all_additional_tickers,
+    get_all_additional_tickers_set,
     get_tickers_for_industry,
     get_industry_code_for_ticker,
+    get_sector_code_for_ticker,
     # Backward compatibility sector exports
     SECTOR_10_ENERGY,
     SECTOR_15_MATERIALS,
@@ -99,8 +101,10 @@ __all__ = [
     # Additional tickers
     "INDUSTRY_TICKERS",
     "get_all_additional_tickers",
+    "get_all_additional_tickers_set",
     "get_tickers_for_industry",
     "get_industry_code_for_ticker",
+    "get_sector_code_for_ticker",
     # Sector exports
     "SECTOR_10_ENERGY",
     "SECTOR_15_MATERIALS",
@@ -12,7 +12,9 @@ Code Format: SSIIXX
 - XX: Reserved for sub-industry expansion (00 by default)
 """
 
-from typing import Dict, List
+from itertools import chain
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping
 
 # =============================================================================
 # SECTOR 10: ENERGY
@@ -869,7 +871,7 @@ INDUSTRY_601100_REAL_ESTATE_SERVICES: List[str] = [
 # COMBINED EXPORTS - ALL TICKERS BY INDUSTRY
 # =============================================================================
 
-INDUSTRY_TICKERS: Dict[str, List[str]] = {
+INDUSTRY_TICKERS: Mapping[str, List[str]] = MappingProxyType({
     # Energy
     "100100": INDUSTRY_100100_COAL,
     "100200": INDUSTRY_100200_OIL_GAS_DRILLING,
@@ -1011,22 +1013,29 @@ INDUSTRY_TICKERS: Dict[str, List[str]] = {
     "600900": INDUSTRY_600900_REITS_SPECIALTY,
     "601000": INDUSTRY_601000_REAL_ESTATE_DEVELOPMENT,
     "601100": INDUSTRY_601100_REAL_ESTATE_SERVICES,
-}
+})
+
+
+# All tickers in INDUSTRY_TICKERS order, duplicates removed (first occurrence wins)
+_ALL_UNIQUE_TICKERS = tuple(dict.fromkeys(chain.from_iterable(INDUSTRY_TICKERS.values())))
+_ALL_UNIQUE_TICKERS_SET = frozenset(_ALL_UNIQUE_TICKERS)
+
+# Reverse lookup ticker -> industry code; the first industry listing a ticker wins
+_INDUSTRY_CODE_BY_TICKER: Mapping[str, str] = MappingProxyType({
+    ticker: code
+    for code, tickers in reversed(INDUSTRY_TICKERS.items())
+    for ticker in tickers
+})
 
 
 def get_all_additional_tickers() -> List[str]:
     """Get all additional tickers as a flat list."""
-    all_tickers = []
-    for tickers in INDUSTRY_TICKERS.values():
-        all_tickers.extend(tickers)
-    # Remove duplicates while preserving order
-    seen = set()
-    unique = []
-    for t in all_tickers:
-        if t not in seen:
-            seen.add(t)
-            unique.append(t)
-    return unique
+    return list(_ALL_UNIQUE_TICKERS)
+
+
+def get_all_additional_tickers_set() -> FrozenSet[str]:
+    """Get all additional tickers as a shared frozenset (preferred for membership tests)."""
+    return _ALL_UNIQUE_TICKERS_SET
 
 
 def get_tickers_for_industry(industry_code: str) -> List[str]:
@@ -1036,10 +1045,12 @@ def get_tickers_for_industry(industry_code: str) -> List[str]:
 
 def get_industry_code_for_ticker(ticker: str) -> str:
     """Find the industry code for a given ticker."""
-    for code, tickers in INDUSTRY_TICKERS.items():
-        if ticker in tickers:
-            return code
-    return ""
+    return _INDUSTRY_CODE_BY_TICKER.get(ticker, "")
+
+
+def get_sector_code_for_ticker(ticker: str) -> str:
+    """Find the 2-digit sector code for a given ticker."""
+    return _INDUSTRY_CODE_BY_TICKER.get(ticker, "")[:2]
 
 
 # Backward compatibility - sector-based exports
@@ -17,6 +17,7 @@ from src.models import GICSSubIndustry, Stock, StockPrice, init_db
 from src.ingestion.sources.yfinance_source import yfinance_source
 from src.ingestion.sources.wikipedia_source import wikipedia_source
 from src.ingestion.mappers.gics_mapper import gics_mapper
+from src.services.data_service import clear_subindustry_info_cache
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +150,9 @@ class InitialLoadPipeline:
         
         self.db.commit()
         logger.info(f"Created {count} GICS sub-industry records")
+        
+        # Drop any sub-industry info cached by the dashboard in this process
+        clear_subindustry_info_cache()
         return count
     
     def _create_stock_records(self, use_all_indices: bool = True) -> int:
@@ -17,6 +17,7 @@ from sqlalchemy import func
 from src.config import settings
 from src.models import SessionLocal, Stock, StockPrice, JobLog, JobStatus
 from src.ingestion.sources.yfinance_source import yfinance_source
+from src.services.data_service import clear_stock_rs_matrix_cache
 
 logger = logging.getLogger(__name__)
 
@@ -265,6 +266,10 @@ def run_price_refresh_job(days_back: int = 7, db_session=None) -> dict:
         
         db.commit()
         
+        # Stock RS matrices cached by the dashboard are now stale
+        if prices_added > 0:
+            clear_stock_rs_matrix_cache()
+        
         # Update job log
         job_log.status = JobStatus.SUCCESS
         job_log.completed_at = datetime.now(timezone.utc)
@@ -436,6 +441,10 @@ def run_missing_prices_job(lookback_days: int = 14, db_session=None) -> dict:
         
         db.commit()
         
+        # Stock RS matrices cached by the dashboard are now stale
+        if prices_added > 0:
+            clear_stock_rs_matrix_cache()
+        
         # Update job log
         job_log.status = JobStatus.SUCCESS
         job_log.completed_at = datetime.now(timezone.utc)
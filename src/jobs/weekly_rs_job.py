@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 
 from src.models import SessionLocal, JobLog, JobStatus
 from src.services.aggregator import SubIndustryAggregator, get_last_friday
+from src.services.data_service import clear_stock_rs_matrix_cache
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,9 @@ def run_weekly_data_update() -> dict:
         aggregator = SubIndustryAggregator(db)
         records_stored = aggregator.store_weekly_rs(week_end)
         
+        # A new week changes which weeks the stock RS matrices cover
+        clear_stock_rs_matrix_cache()
+        
         result['rs_records_processed'] = records_stored
         
         # Update job log
@@ -82,6 +82,20 @@ def check_and_update_data() -> None:
         db.close()
 
 
+def prefetch_dashboard_data() -> None:
+    """Warm the dashboard's sub-industry info cache with a single query."""
+    from src.models import SessionLocal
+    from src.services.data_service import prefetch_subindustry_info
+    
+    db = SessionLocal()
+    try:
+        prefetch_subindustry_info(db)
+    except Exception as e:
+        logger.error(f"Error prefetching sub-industry info: {e}")
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -102,6 +116,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error during data freshness check: {e}")
     
+    # Prefetch reference data used by the dashboard
+    prefetch_dashboard_data()
+    
     # Start scheduler if enabled
     if settings.SCHEDULER_ENABLED:
         try:
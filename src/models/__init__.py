@@ -1,7 +1,7 @@
 """
 SQLAlchemy ORM models for the RS Dashboard.
 """
-from src.models.base import Base, engine, SessionLocal, get_db, init_db
+from src.models.base import Base, engine, SessionLocal, ScopedSession, get_db, init_db
 from src.models.gics import GICSSubIndustry
 from src.models.stock import Stock
 from src.models.price import StockPrice
@@ -12,6 +12,7 @@ __all__ = [
     "Base",
     "engine",
     "SessionLocal",
+    "ScopedSession",
     "get_db",
     "init_db",
     "GICSSubIndustry",
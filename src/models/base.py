@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Generator
 
 from sqlalchemy import create_engine, DateTime, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, scoped_session, sessionmaker
 
 from src.config import settings
 
@@ -31,16 +31,33 @@ class TimestampMixin:
     )
 
 
+# Pool settings so callbacks and jobs reuse warm connections. In-memory SQLite
+# uses a single-connection pool that doesn't accept these options.
+if settings.db_url in ("sqlite://", "sqlite:///:memory:"):
+    pool_options = {}
+else:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
 # Create engine
 engine = create_engine(
     settings.db_url,
     echo=settings.DEBUG,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.db_url else {}
+    connect_args={"check_same_thread": False} if "sqlite" in settings.db_url else {},
+    **pool_options
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Thread-local session registry for dashboard callbacks. The Dash server
+# removes the session when each request's app context is torn down.
+ScopedSession = scoped_session(SessionLocal)
+
 
 def get_db() -> Generator:
     """Dependency for getting database sessions."""
@@ -4,12 +4,14 @@ Data service layer for dashboard queries.
 Provides functions to retrieve RS data formatted for the dashboard.
 """
 import logging
+import threading
+import time
 from datetime import date, timedelta
-from typing import List, Optional, Dict, Tuple
+from typing import Any, Callable, Hashable, List, Optional, Dict, Tuple
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
 
 from src.config import settings
@@ -19,6 +21,52 @@ from src.services.aggregator import get_last_friday, get_week_ranges
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# TTL CACHE HELPER
+# =============================================================================
+
+class _TTLCache:
+    """
+    Thread-safe in-memory cache with a per-entry TTL and a size limit.
+    
+    Dash callbacks run on worker threads, so every read, insert and
+    eviction happens under one lock. When full, the oldest inserted entry
+    is evicted (dicts keep insertion order).
+    """
+    
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ttl_seconds."""
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (expires_at, value)
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet replaced."""
+        with self._lock:
+            return len(self._entries)
+
+
 # =============================================================================
 # SCTR CACHE
 # =============================================================================
@@ -48,6 +96,94 @@ def clear_sctr_cache() -> None:
     logger.info("SCTR cache cleared")
 
 
+# =============================================================================
+# SUB-INDUSTRY INFO CACHE
+# =============================================================================
+
+# Sub-industry metadata only changes when the GICS table is reloaded, so
+# lookups are cached per code for a limited time.
+# Key: subindustry_code -> Value: sub-industry info dict
+SUBINDUSTRY_INFO_TTL_SECONDS = 3600
+_SUBINDUSTRY_INFO_CACHE_MAXSIZE = 2048
+_subindustry_info_cache = _TTLCache(SUBINDUSTRY_INFO_TTL_SECONDS, _SUBINDUSTRY_INFO_CACHE_MAXSIZE)
+
+
+def clear_subindustry_info_cache() -> None:
+    """Clear the sub-industry info cache. Call after the GICS table is updated."""
+    _subindustry_info_cache.clear()
+    logger.info("Sub-industry info cache cleared")
+
+
+def prefetch_subindustry_info(db: Session) -> int:
+    """
+    Load info for every sub-industry into the cache with a single query.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of sub-industries cached
+    """
+    subindustries = db.query(GICSSubIndustry).all()
+    for subindustry in subindustries:
+        _cache_subindustry_info(subindustry)
+    
+    logger.info(f"Prefetched info for {len(subindustries)} sub-industries")
+    return len(subindustries)
+
+
+# =============================================================================
+# STOCK NAME CACHE
+# =============================================================================
+
+# Stock names are near-static, so heatmap clicks can resolve them without
+# a database round-trip.
+# Key: ticker -> Value: stock name
+STOCK_NAME_TTL_SECONDS = 86400
+_STOCK_NAME_CACHE_MAXSIZE = 4096
+_stock_name_cache = _TTLCache(STOCK_NAME_TTL_SECONDS, _STOCK_NAME_CACHE_MAXSIZE)
+
+
+def clear_stock_name_cache() -> None:
+    """Clear the stock name cache. Call after stock records are renamed."""
+    _stock_name_cache.clear()
+    logger.info("Stock name cache cleared")
+
+
+# =============================================================================
+# STOCK RS MATRIX CACHE
+# =============================================================================
+
+# Stock RS matrices are computed on-the-fly from prices, which change at most
+# once per day, so repeat requests for the same view are served from memory.
+# Key: (subindustry_code, sort_by, num_weeks) -> Value: DataFrame
+STOCK_RS_MATRIX_TTL_SECONDS = 3600
+_STOCK_RS_MATRIX_CACHE_MAXSIZE = 256
+_stock_rs_matrix_cache = _TTLCache(STOCK_RS_MATRIX_TTL_SECONDS, _STOCK_RS_MATRIX_CACHE_MAXSIZE)
+
+# Functions called whenever the matrix cache is cleared, so caches built from
+# cached matrices (e.g. dashboard figures) are dropped at the same time
+_stock_rs_matrix_clear_callbacks: List[Callable[[], None]] = []
+
+
+def on_stock_rs_matrix_cache_clear(callback: Callable[[], None]) -> None:
+    """
+    Register a function to call whenever the stock RS matrix cache is cleared.
+    
+    Args:
+        callback: Function taking no arguments
+    """
+    _stock_rs_matrix_clear_callbacks.append(callback)
+
+
+def clear_stock_rs_matrix_cache() -> None:
+    """Clear the stock RS matrix cache. Call after prices or weekly RS are updated."""
+    _stock_rs_matrix_cache.clear()
+    for callback in _stock_rs_matrix_clear_callbacks:
+        callback()
+    logger.info("Stock RS matrix cache cleared")
+
+
 # =============================================================================
 # HELPER FUNCTIONS FOR SCTR WITH AGGREGATED PRICES
 # =============================================================================
@@ -733,6 +869,9 @@ def get_subindustry_info(db: Session, subindustry_code: str) -> Optional[dict]:
     """
     Get information about a specific sub-industry.
     
+    Results are cached for SUBINDUSTRY_INFO_TTL_SECONDS; the returned dict is
+    shared between callers and must not be mutated.
+    
     Args:
         db: Database session
         subindustry_code: GICS sub-industry code
@@ -740,6 +879,10 @@ def get_subindustry_info(db: Session, subindustry_code: str) -> Optional[dict]:
     Returns:
         Dict with sub-industry info or None if not found
     """
+    cached = _subindustry_info_cache.get(subindustry_code)
+    if cached is not None:
+        return cached
+    
     subindustry = db.query(GICSSubIndustry).filter(
         GICSSubIndustry.code == subindustry_code
     ).first()
@@ -747,12 +890,80 @@ def get_subindustry_info(db: Session, subindustry_code: str) -> Optional[dict]:
     if not subindustry:
         return None
     
-    return {
+    return _cache_subindustry_info(subindustry)
+
+
+def _cache_subindustry_info(subindustry: GICSSubIndustry) -> dict:
+    """Build the info dict for a sub-industry row and store it in the cache."""
+    info = {
         'code': subindustry.code,
         'name': subindustry.name,
         'sector_name': subindustry.sector_name,
         'industry_name': subindustry.industry_name,
     }
+    _subindustry_info_cache.set(subindustry.code, info)
+    
+    return info
+
+
+def get_stock_with_subindustry(
+    db: Session,
+    ticker: str
+) -> Tuple[Optional[Stock], Optional[dict]]:
+    """
+    Get a stock and its sub-industry info in a single query.
+    
+    The sub-industry info is also stored in the get_subindustry_info cache.
+    
+    Args:
+        db: Database session
+        ticker: Stock ticker symbol
+    
+    Returns:
+        Tuple of (Stock or None, sub-industry info dict or None)
+    """
+    row = db.query(Stock, GICSSubIndustry).outerjoin(
+        GICSSubIndustry, Stock.gics_subindustry_code == GICSSubIndustry.code
+    ).filter(Stock.ticker == ticker).first()
+    
+    if not row:
+        return None, None
+    
+    stock, subindustry = row
+    if not subindustry:
+        return stock, None
+    
+    return stock, _cache_subindustry_info(subindustry)
+
+
+def get_stock_name(db: Session, ticker: str) -> Optional[str]:
+    """
+    Get the name of a stock.
+    
+    Results are cached for STOCK_NAME_TTL_SECONDS.
+    
+    Args:
+        db: Database session
+        ticker: Stock ticker symbol
+    
+    Returns:
+        Stock name or None if the ticker is not found
+    """
+    cached = _stock_name_cache.get(ticker)
+    if cached is not None:
+        return cached
+    
+    # Scalar column query - no ORM instance is loaded just to read the name
+    name = db.execute(
+        select(Stock.name).where(Stock.ticker == ticker)
+    ).scalar_one_or_none()
+    
+    if name is None:
+        return None
+    
+    _stock_name_cache.set(ticker, name)
+    
+    return name
 
 
 def get_stock_rs_matrix_data(
@@ -778,6 +989,8 @@ def get_stock_rs_matrix_data(
         - week_end_date
         - mansfield_rs
         - rs_percentile
+        
+        Rows are grouped by stock in sort order, most recent week first.
     """
     from src.models import StockPrice
     from src.services.rs_calculator import MansfieldRSCalculator, calculate_percentile_ranks
@@ -906,6 +1119,47 @@ def get_stock_rs_matrix_data(
     return df
 
 
+def get_cached_stock_rs_matrix_data(
+    db: Session,
+    subindustry_code: str,
+    num_weeks: int = None,
+    sort_by: str = "latest"
+) -> pd.DataFrame:
+    """
+    Cached version of get_stock_rs_matrix_data.
+    
+    Results are cached for STOCK_RS_MATRIX_TTL_SECONDS. The returned DataFrame
+    is the cached object itself, shared between callers: treat it as
+    read-only and derive new frames (filter, sort_values, assign) instead of
+    modifying it in place. Callers may rely on getting the identical object
+    back until the entry expires or the cache is cleared.
+    
+    Args:
+        db: Database session
+        subindustry_code: GICS sub-industry code
+        num_weeks: Number of weeks to include (default from settings)
+        sort_by: Sort method - 'latest', 'change', or 'alpha'
+    
+    Returns:
+        DataFrame in the same format as get_stock_rs_matrix_data
+    """
+    key = (subindustry_code, sort_by, num_weeks)
+    cached = _stock_rs_matrix_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    df = get_stock_rs_matrix_data(
+        db=db,
+        subindustry_code=subindustry_code,
+        num_weeks=num_weeks,
+        sort_by=sort_by
+    )
+    
+    _stock_rs_matrix_cache.set(key, df)
+    
+    return df
+
+
 def get_stock_price_with_rs(
     db: Session,
     ticker: str,
@@ -1313,7 +1567,12 @@ def _calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
 
 
 def _sort_stocks(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
-    """Sort stock DataFrame by specified method."""
+    """
+    Sort stock DataFrame by specified method.
+    
+    Sorts are stable so each stock's rows keep their most-recent-first week
+    order, letting callers read the week order directly off the frame.
+    """
     if df.empty:
         return df
     
@@ -1331,7 +1590,7 @@ def _sort_stocks(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
             categories=sort_order,
             ordered=True
         )
-        df = df.sort_values('sort_key').drop('sort_key', axis=1)
+        df = df.sort_values('sort_key', kind='stable').drop('sort_key', axis=1)
         
     elif sort_by == "change":
         # Sort by 4-week RS change
@@ -1361,11 +1620,11 @@ def _sort_stocks(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
                     categories=sort_order,
                     ordered=True
                 )
-                df = df.sort_values('sort_key').drop('sort_key', axis=1)
+                df = df.sort_values('sort_key', kind='stable').drop('sort_key', axis=1)
             
     else:  # 'alpha' or default
         # Alphabetical by stock name
-        df = df.sort_values('stock_name')
+        df = df.sort_values('stock_name', kind='stable')
     
     return df
 
@@ -1888,6 +2147,8 @@ def get_stock_sctr_matrix_data(
         - week_end_date
         - sctr_score
         - sctr_percentile
+        
+        Rows are grouped by stock in sort order, most recent week first.
     """
     from src.models import StockPrice
     from src.services.sctr_calculator import SCTRCalculator, calculate_sctr_percentile_ranks
@@ -2012,7 +2273,7 @@ def get_stock_sctr_matrix_data(
 
 
 def _sort_stocks_sctr(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
-    """Sort stock SCTR DataFrame by specified method."""
+    """Sort stock SCTR DataFrame by specified method (stable, see _sort_stocks)."""
     if df.empty:
         return df
     
@@ -2027,7 +2288,7 @@ def _sort_stocks_sctr(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
             categories=sort_order,
             ordered=True
         )
-        df = df.sort_values('sort_key').drop('sort_key', axis=1)
+        df = df.sort_values('sort_key', kind='stable').drop('sort_key', axis=1)
         
     elif sort_by == "change":
         weeks = sorted(df['week_end_date'].unique(), reverse=True)
@@ -2054,10 +2315,10 @@ def _sort_stocks_sctr(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
                     categories=sort_order,
                     ordered=True
                 )
-                df = df.sort_values('sort_key').drop('sort_key', axis=1)
+                df = df.sort_values('sort_key', kind='stable').drop('sort_key', axis=1)
             
     else:  # 'alpha'
-        df = df.sort_values('stock_name')
+        df = df.sort_values('stock_name', kind='stable')
     
     return df
 
@@ -0,0 +1,46 @@
+"""
+Tests for the heatmap color utilities.
+"""
+import math
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.dashboard.utils.colors import percentile_to_hex, percentile_to_rgb
+
+
+class TestPercentileToHex:
+    """Tests for percentile_to_hex."""
+    
+    def test_whole_percentiles_match_gradient(self):
+        """Whole percentiles use the exact percentile_to_rgb colors."""
+        for p in range(101):
+            r, g, b = percentile_to_rgb(float(p))
+            assert percentile_to_hex(p) == f"#{r:02x}{g:02x}{b:02x}"
+    
+    def test_known_colors(self):
+        """Endpoints of the scale."""
+        assert percentile_to_hex(0) == "#dc2626"
+        assert percentile_to_hex(100) == "#15a33d"
+    
+    def test_fractional_percentiles_round(self):
+        """Fractional percentiles round to the nearest whole percentile."""
+        assert percentile_to_hex(49.4) == percentile_to_hex(49)
+        assert percentile_to_hex(49.5) == percentile_to_hex(50)
+        assert percentile_to_hex(np.float64(80.2)) == percentile_to_hex(80)
+    
+    def test_missing_values(self):
+        """None and NaN get the 0th percentile color."""
+        assert percentile_to_hex(None) == percentile_to_hex(0)
+        assert percentile_to_hex(float("nan")) == percentile_to_hex(0)
+        assert percentile_to_hex(np.nan) == percentile_to_hex(0)
+    
+    def test_out_of_range_values_clamp(self):
+        """Values outside 0-100 are clamped to the ends of the scale."""
+        assert percentile_to_hex(-5) == percentile_to_hex(0)
+        assert percentile_to_hex(150) == percentile_to_hex(100)
+        assert percentile_to_hex(math.inf) == percentile_to_hex(100)
+        assert percentile_to_hex(-math.inf) == percentile_to_hex(0)
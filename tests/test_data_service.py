@@ -0,0 +1,82 @@
+"""
+Tests for the data service caches.
+"""
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services import data_service
+from src.services.data_service import _TTLCache
+
+
+class TestTTLCache:
+    """Tests for the locked TTL cache shared by the data service caches."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace time.monotonic in the data service with a settable clock."""
+        now = [1000.0]
+        monkeypatch.setattr(data_service.time, "monotonic", lambda: now[0])
+        return now
+    
+    def test_get_missing_key(self):
+        """Unknown keys return None."""
+        cache = _TTLCache(ttl_seconds=60, maxsize=4)
+        assert cache.get("missing") is None
+    
+    def test_entry_expires_after_ttl(self, clock):
+        """Entries are served until the TTL passes, then treated as missing."""
+        cache = _TTLCache(ttl_seconds=60, maxsize=4)
+        cache.set("a", 1)
+        
+        clock[0] += 59.9
+        assert cache.get("a") == 1
+        
+        clock[0] += 0.1
+        assert cache.get("a") is None
+    
+    def test_set_refreshes_ttl(self, clock):
+        """Setting a key again restarts its TTL."""
+        cache = _TTLCache(ttl_seconds=60, maxsize=4)
+        cache.set("a", 1)
+        clock[0] += 50
+        cache.set("a", 2)
+        clock[0] += 50
+        assert cache.get("a") == 2
+    
+    def test_evicts_oldest_entry_when_full(self):
+        """Inserting a new key into a full cache evicts the oldest inserted key."""
+        cache = _TTLCache(ttl_seconds=60, maxsize=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper())
+        
+        cache.get("a")  # reads do not change eviction order
+        cache.set("d", "D")
+        
+        assert len(cache) == 3
+        assert cache.get("a") is None
+        assert [cache.get(key) for key in ("b", "c", "d")] == ["B", "C", "D"]
+    
+    def test_overwrite_does_not_evict(self):
+        """Overwriting an existing key in a full cache keeps every entry."""
+        cache = _TTLCache(ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        
+        assert len(cache) == 2
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
+    
+    def test_clear(self):
+        """clear() removes every entry."""
+        cache = _TTLCache(ttl_seconds=60, maxsize=4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        
+        assert len(cache) == 0
+        assert cache.get("a") is None
+        assert cache.get("b") is None
@@ -0,0 +1,117 @@
+"""
+Tests for the sub-industry ETF lookups.
+"""
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.dashboard.utils.etf_mapper import (
+    DEFAULT_ETF,
+    GICS_SUBINDUSTRY_ETF_MAP,
+    INDUSTRY_ETFS,
+    SECTOR_ETFS,
+    _build_industry_etfs,
+    get_etf_for_subindustry,
+    normalize_name,
+)
+
+
+def scan_etf_for_subindustry(subindustry_name: str, sector_name: str = "") -> str:
+    """Reference lookup: the ordered scans the lookup tables replace."""
+    if not subindustry_name:
+        return DEFAULT_ETF
+    
+    normalized_input = normalize_name(subindustry_name)
+    
+    # Exact, then normalized, then partial match in the GICS mapping
+    for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
+        if entry.name.lower() == subindustry_name.lower():
+            return entry.primary_etf
+    for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
+        if normalize_name(entry.name) == normalized_input:
+            return entry.primary_etf
+    for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
+        normalized_entry = normalize_name(entry.name)
+        if normalized_input in normalized_entry or normalized_entry in normalized_input:
+            return entry.primary_etf
+    
+    # Normalized, then partial match in the legacy mapping
+    for industry_key, etf in INDUSTRY_ETFS.items():
+        if normalize_name(industry_key) == normalized_input:
+            return etf
+    for industry_key, etf in INDUSTRY_ETFS.items():
+        normalized_key = normalize_name(industry_key)
+        if normalized_key in normalized_input or normalized_input in normalized_key:
+            return etf
+    
+    # Sector fallback
+    if sector_name and SECTOR_ETFS:
+        normalized_sector = sector_name.lower().strip()
+        for entry in GICS_SUBINDUSTRY_ETF_MAP.values():
+            if entry.sector_name.lower() == normalized_sector:
+                return SECTOR_ETFS.get(entry.sector_code, DEFAULT_ETF)
+    
+    return DEFAULT_ETF
+
+
+GICS_NAMES = [entry.name for entry in GICS_SUBINDUSTRY_ETF_MAP.values()]
+LEGACY_NAMES = list(INDUSTRY_ETFS)
+
+
+class TestGetEtfForSubindustry:
+    """get_etf_for_subindustry must match the ordered scans it replaced."""
+    
+    @pytest.mark.parametrize("name", GICS_NAMES + LEGACY_NAMES)
+    def test_known_names(self, name):
+        """Every GICS and legacy name, as written and with case/spacing changes."""
+        for variant in (name, name.upper(), name.lower(), f"  {name} ", name.replace("&", "and")):
+            assert get_etf_for_subindustry(variant) == scan_etf_for_subindustry(variant)
+    
+    @pytest.mark.parametrize("name", [
+        "Semiconductor",
+        "Oil & Gas",
+        "Banks,",
+        "Biotech",
+        "Software",
+        "REIT",
+        "Insurance Brokers and More",
+        "Gas",
+    ])
+    def test_partial_matches(self, name):
+        """Partial names resolve to the first entry found by the scans."""
+        assert get_etf_for_subindustry(name) == scan_etf_for_subindustry(name)
+    
+    @pytest.mark.parametrize("sector", [
+        "Energy",
+        " energy ",
+        "Information Technology",
+        "Health Care",
+        "Real Estate",
+        "Not A Sector",
+        "",
+    ])
+    def test_sector_fallback(self, sector):
+        """Unknown sub-industries fall back to the sector ETF, then SPY."""
+        name = "Zzz Unknown Widgets"
+        assert get_etf_for_subindustry(name, sector) == scan_etf_for_subindustry(name, sector)
+    
+    def test_missing_name(self):
+        """Missing names get the default ETF."""
+        assert get_etf_for_subindustry("") == DEFAULT_ETF
+        assert get_etf_for_subindustry(None) == DEFAULT_ETF
+
+
+class TestBuildIndustryEtfs:
+    """Tests for _build_industry_etfs."""
+    
+    def test_keeps_pair_order(self):
+        """Names map to their ETFs in pair order."""
+        etfs = _build_industry_etfs([("B", "XLB"), ("A", "XLA")])
+        assert list(etfs.items()) == [("B", "XLB"), ("A", "XLA")]
+    
+    def test_duplicate_name_raises(self):
+        """A repeated name fails instead of silently keeping the last ETF."""
+        with pytest.raises(ValueError, match="Duplicate sub-industry name"):
+            _build_industry_etfs([("Banks", "KBE"), ("Gold", "GDX"), ("Banks", "KRE")])
@@ -0,0 +1,137 @@
+"""
+Tests for the stock page DataFrame helpers.
+"""
+import numpy as np
+import pandas as pd
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.dashboard.callbacks.stock_callbacks import downsample_price_data, limit_top_stocks
+
+
+def _matrix(rows):
+    """Build a stock matrix frame from (ticker, week_label, rs_percentile) rows."""
+    return pd.DataFrame(rows, columns=["ticker", "week_label", "rs_percentile"])
+
+
+class TestLimitTopStocks:
+    """Tests for limit_top_stocks."""
+    
+    def test_keeps_top_n_by_mean(self):
+        """Only the stocks with the highest mean percentile are kept."""
+        df = _matrix([
+            ("AAA", "w2", 10), ("AAA", "w1", 30),   # mean 20
+            ("BBB", "w2", 90), ("BBB", "w1", 70),   # mean 80
+            ("CCC", "w2", 50), ("CCC", "w1", 60),   # mean 55
+        ])
+        
+        result = limit_top_stocks(df, "rs_percentile", 2)
+        
+        assert set(result["ticker"]) == {"BBB", "CCC"}
+    
+    def test_preserves_row_order(self):
+        """Kept rows stay in their original (sorted) order."""
+        df = _matrix([
+            ("CCC", "w2", 50), ("CCC", "w1", 60),
+            ("AAA", "w2", 10), ("AAA", "w1", 30),
+            ("BBB", "w2", 90), ("BBB", "w1", 70),
+        ])
+        
+        result = limit_top_stocks(df, "rs_percentile", 2)
+        
+        assert list(result.index) == [0, 1, 4, 5]
+        assert list(result["ticker"]) == ["CCC", "CCC", "BBB", "BBB"]
+    
+    def test_zero_or_none_keeps_every_stock(self):
+        """top_n of 0 or None returns the frame unchanged."""
+        df = _matrix([("AAA", "w1", 10), ("BBB", "w1", 90)])
+        
+        assert limit_top_stocks(df, "rs_percentile", 0) is df
+        assert limit_top_stocks(df, "rs_percentile", None) is df
+    
+    def test_within_limit_returns_frame(self):
+        """Frames with at most top_n stocks are returned as is."""
+        df = _matrix([("AAA", "w1", 10), ("BBB", "w1", 90)])
+        
+        assert limit_top_stocks(df, "rs_percentile", 2) is df
+    
+    def test_empty_frame(self):
+        """Empty frames pass through."""
+        df = _matrix([])
+        
+        assert limit_top_stocks(df, "rs_percentile", 5).empty
+    
+    def test_missing_values_ignored_in_mean(self):
+        """Weeks without data do not drag a stock's mean down."""
+        df = _matrix([
+            ("AAA", "w2", None), ("AAA", "w1", 80),  # mean 80
+            ("BBB", "w2", 60), ("BBB", "w1", 60),    # mean 60
+        ])
+        
+        result = limit_top_stocks(df, "rs_percentile", 1)
+        
+        assert set(result["ticker"]) == {"AAA"}
+
+
+def _prices(n):
+    """Build n daily OHLCV bars with a trailing indicator column."""
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "open": np.arange(n, dtype=float) + 100,
+        "high": np.arange(n, dtype=float) + 110,
+        "low": np.arange(n, dtype=float) + 90,
+        "close": np.arange(n, dtype=float) + 105,
+        "volume": np.full(n, 10, dtype=np.int64),
+        "rs_line": np.arange(n, dtype=float) / 10,
+    })
+
+
+class TestDownsamplePriceData:
+    """Tests for downsample_price_data."""
+    
+    def test_within_limit_returns_frame(self):
+        """Frames with at most max_points rows are returned as is."""
+        df = _prices(5)
+        
+        assert downsample_price_data(df, max_points=5) is df
+    
+    def test_bucket_aggregation(self):
+        """Each bucket keeps first open, max high, min low, last close and summed volume."""
+        df = _prices(6)
+        df.loc[1, "high"] = 500
+        df.loc[0, "low"] = 1
+        
+        result = downsample_price_data(df, max_points=3)
+        
+        assert len(result) == 3
+        first = result.iloc[0]
+        assert first["open"] == df.loc[0, "open"]
+        assert first["high"] == 500
+        assert first["low"] == 1
+        assert first["close"] == df.loc[1, "close"]
+        assert first["volume"] == 20
+        assert first["date"] == df.loc[1, "date"]
+        assert first["rs_line"] == df.loc[1, "rs_line"]
+    
+    def test_preserves_order_and_columns(self):
+        """Buckets stay in date order and keep every column."""
+        df = _prices(1000)
+        
+        result = downsample_price_data(df, max_points=300)
+        
+        assert len(result) == 300
+        assert list(result.columns) == list(df.columns)
+        assert result["date"].is_monotonic_increasing
+        assert result["date"].iloc[-1] == df["date"].iloc[-1]
+        assert result["volume"].sum() == df["volume"].sum()
+    
+    def test_without_volume_column(self):
+        """Frames without volume are still merged."""
+        df = _prices(10).drop(columns="volume")
+        
+        result = downsample_price_data(df, max_points=5)
+        
+        assert len(result) == 5
+        assert "volume" not in result.columns